@@ -1,8 +1,11 @@
+import logging
 from src.database_editor import FrescoDatabase
 from Examples.ManuscriptExamples.example1 import entry_koutas_and_bournas_2019
 from Examples.ManuscriptExamples.example2 import entry_akhoundi_et_al_2018
 from Examples.ManuscriptExamples.example3 import entry_rousakis_et_al_2025
 
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+
 
 db = FrescoDatabase("Database/example_db", compress_db=False, auto_back_up=False)
 
@@ -1,28 +1,60 @@
+import logging
+import os
+import sys
+import time
 from src.database_editor import FrescoDatabase
 from fresco_v1.entries import entries
 
 
-DATABASE_ENTRY_ID=0
-for key, value in entries.items():
+def build(db, csv_file):
+    """Apply the specimens edited, added or removed since the last build and refresh the CSV"""
+    # Entry ids follow the order of the specimens in the fresco_v1 manifest
+    database_entries = {database_entry_id: value for database_entry_id, value in enumerate(entries.values(), start=1)}
+
+    # Only specimens edited, added or removed since the last build are processed. The whole
+    # catalogue normalises in well under a second, faster than starting worker processes
+    changes = db.sync_entries(
+        database_entries,
+        show_error_fields=False
+    )
+
+    if changes["added"] or changes["changed"] or changes["removed"] or not os.path.exists(csv_file):
+        db.export_to_csv(csv_file)
+    else:
+        print(f"{csv_file} is up to date")
+    return changes
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    # python create_fresco_v1.py --watch keeps rebuilding while the fresco_v1 files are edited
+    WATCH = "--watch" in sys.argv[1:]
+
     DATABASE_NAME = "fresco_v1"
-    DATABASE_ENTRY_ID = DATABASE_ENTRY_ID+1
-    print("\n", key, " - ", DATABASE_ENTRY_ID)
-    
-    db = FrescoDatabase(f"Database/{DATABASE_NAME}", 
-                        compress_db=False, 
+    CSV_FILE = f"Database/{DATABASE_NAME}.csv"
+
+    db = FrescoDatabase(f"Database/{DATABASE_NAME}",
+                        compress_db=False,
                         auto_back_up=False,
                         show_conversion=False,
                         show_invalid_object=False)
-   
-    db.add_entry(
-        overwrite=True,
-        entry_id=DATABASE_ENTRY_ID,
-        entry_data = value,
-        show_error_fields=False
-    )
 
-    DATABSE_FOLDER_PATH = "Database/"
-    CAD_FOLDER_PATH = "Models/"
-    CAD_NAME = key
+    build(db, CSV_FILE)
 
-db.export_to_csv('Database/fresco_v1')
+    if WATCH:
+        print(f"Watching {entries.folder} for changes, press Ctrl+C to stop")
+        try:
+            while True:
+                try:
+                    edited = entries.wait_for_changes()
+                    start = time.perf_counter()
+                    changes = build(db, CSV_FILE)
+                except (ValueError, OSError) as e:
+                    # Half-written or malformed specimen files or manifest, wait for the next save
+                    print(f"Rebuild failed: {e}")
+                    continue
+                print(f"Rebuilt in {time.perf_counter() - start:.2f}s - edited: {', '.join(sorted(edited))} - "
+                      f"added: {changes['added']}, changed: {changes['changed']}, removed: {changes['removed']}")
+        except KeyboardInterrupt:
+            print("Watch stopped")
@@ -1,5 +1,8 @@
+import logging
 from src.ppee_model import PPEEFrameGenerator
 
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+
 # USER Configuration
 DATABASE_FOLDER_PATH = "Database/"
 CAD_FOLDER_PATH = "Models/"
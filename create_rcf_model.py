@@ -1,5 +1,8 @@
+import logging
 from src.rcf_model import RCFrameGenerator
 
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+
 generator = RCFrameGenerator(
     database_folder_path = "Database/",
     cad_folder_path = "Models/",
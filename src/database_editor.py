@@ -1,54 +1,289 @@
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Sequence, Set, Tuple, Union
 import json
+import ast
 import os
 import shutil
-import copy
 from datetime import datetime
+from types import MappingProxyType
 import gzip
 import csv
+import hashlib
+import math
+import time
+import bisect
+import itertools
+import re
+from fractions import Fraction
+from functools import lru_cache
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import contextlib
+import queue
+import tempfile
+import threading
+import logging
+from dataclasses import dataclass, field
 from .db_fields import RCF_FIELD_CONFIG, RCF_DB_EMPTY_FIELDS
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pq = None
+
+logger = logging.getLogger(__name__)
+
+
+def _freeze_units(units: Dict[str, Dict[str, float]]) -> MappingProxyType:
+    """Read-only view of a {unit_type: {unit: to_base_factor}} table"""
+    return MappingProxyType({unit_type: MappingProxyType(dict(table)) for unit_type, table in units.items()})
+
+
+# Process-wide unit registry shared by every FrescoUnits instance (read-only)
+_BASIC_UNITS = _freeze_units({
+    'Length': {
+        'm': 1, 'cm': 0.01, 'mm': 0.001, 'in': 0.0254, 'ft': 0.3048
+    },
+    'Time': {
+        's': 1, 'min': 60, 'hr': 3600, 'day': 86400
+    },
+    'Mass': {
+        'kg': 1, 'g': 0.001, 'tonne': 1000, 'lb': 0.45359237
+    },
+    'Temperature': {'K': 1, 'C': 1, 'F': 1},
+    'Pressure': {
+        'Pa': 1, 'kPa': 1000, 'MPa': 1000000, 'GPa': 1000000000,
+        'N/mm^2': 1000000, 'psi': 6894.757293168360, 'ksi': 6894757.293168360
+    },
+    'Concentrated_Force': {
+        'N': 1, 'kN': 1000, 'MN': 1000000, 'lbf': 4.448221615260500, 'kip': 4448.221615260500
+    },
+    'Distributed_Force': {
+        'N/m': 1, 'kN/m': 1000, 'N/mm': 1000, 'kN/mm': 1000000,
+        'lbf/ft': 14.59390293720640, 
+        'kip/ft': 14593.90293720640
+    },
+    'Work': {
+        'J': 1, 'kJ': 1000, 'N*m': 1, 'kN*m': 1000, 'N*mm': 0.001, 'kN*mm': 1,
+        'lbf*in': 0.1129848290276170, 'lbf*ft': 1.355817948331400, 
+        'kip*in': 112.9848290276170, 'kip*ft': 1355.817948331400
+    },
+    'Density': {
+        'kg/m^3': 1, 'g/cm^3': 1000, 'lb/ft^3': 16.0185, 'pcf': 16.0185
+    },
+    'Strain': {
+        'strain': 1, 'percent': 0.01, '%': 0.01, 'ratio': 1
+    }
+})
+
+# Temperature affine transforms: to_value = from_value * scale + offset
+_TEMPERATURE_AFFINE = MappingProxyType({
+    ('C', 'K'): (1.0, 273.15), ('K', 'C'): (1.0, -273.15),
+    ('C', 'F'): (9/5, 32.0), ('F', 'C'): (5/9, -32 * 5/9),
+    ('K', 'F'): (9/5, 32 - 273.15 * 9/5), ('F', 'K'): (5/9, 273.15 - 32 * 5/9)
+})
+
+
+def _pair_factor(units: Dict[str, Dict[str, float]], unit_type: str, from_unit: str, to_unit: str) -> Tuple[float, float, float]:
+    """(multiplier, divisor, offset) converting from_unit to to_unit within unit_type"""
+    if unit_type == 'Temperature':
+        scale, offset = _TEMPERATURE_AFFINE.get((from_unit, to_unit), (1.0, 0.0))
+        return (scale, 1.0, offset)
+    return (units[unit_type][from_unit], units[unit_type][to_unit], 0.0)
+
+
+# Flat (unit_type, from_unit, to_unit) -> factor table for every registered pair
+_BASIC_FACTORS = MappingProxyType({
+    (unit_type, from_unit, to_unit): _pair_factor(_BASIC_UNITS, unit_type, from_unit, to_unit)
+    for unit_type, table in _BASIC_UNITS.items()
+    for from_unit in table
+    for to_unit in table
+})
+
+
+# Named unit systems: unit_type -> unit. Unit types not listed (Time, Strain)
+# keep their current unit when a preset is applied.
+UNIT_SYSTEM_PRESETS = MappingProxyType({
+    'SI-mm': MappingProxyType({
+        'Length': 'mm', 'Mass': 'kg', 'Pressure': 'MPa', 'Concentrated_Force': 'kN',
+        'Distributed_Force': 'kN/m', 'Work': 'kJ', 'Density': 'kg/m^3'
+    }),
+    'SI-m': MappingProxyType({
+        'Length': 'm', 'Mass': 'kg', 'Pressure': 'Pa', 'Concentrated_Force': 'N',
+        'Distributed_Force': 'N/m', 'Work': 'J', 'Density': 'kg/m^3'
+    }),
+    'US': MappingProxyType({
+        'Length': 'in', 'Mass': 'lb', 'Pressure': 'ksi', 'Concentrated_Force': 'kip',
+        'Distributed_Force': 'kip/ft', 'Work': 'kip*in', 'Density': 'lb/ft^3'
+    })
+})
+
+
+# Dimension exponent vectors over the base dimensions (length, mass, time, angle)
+_BASE_DIMENSIONS = ('L', 'M', 'T', 'A')
+
+
+def _dimension(L=0, M=0, T=0, A=0) -> Tuple[Fraction, ...]:
+    return (Fraction(L), Fraction(M), Fraction(T), Fraction(A))
+
+
+_DIMENSIONLESS = _dimension()
+
+_UNIT_TYPE_DIMENSIONS = MappingProxyType({
+    'Length': _dimension(L=1),
+    'Time': _dimension(T=1),
+    'Mass': _dimension(M=1),
+    'Pressure': _dimension(L=-1, M=1, T=-2),
+    'Concentrated_Force': _dimension(L=1, M=1, T=-2),
+    'Distributed_Force': _dimension(M=1, T=-2),
+    'Work': _dimension(L=2, M=1, T=-2),
+    'Density': _dimension(L=-3, M=1),
+    'Strain': _DIMENSIONLESS
+})
+
+# Atomic unit symbols usable in compound expressions: symbol -> (SI factor, dimension)
+_UNIT_ATOMS = MappingProxyType({
+    **{
+        unit: (factor, _UNIT_TYPE_DIMENSIONS[unit_type])
+        for unit_type, table in _BASIC_UNITS.items() if unit_type in _UNIT_TYPE_DIMENSIONS
+        for unit, factor in table.items() if re.fullmatch(r'[A-Za-z%]+', unit)
+    },
+    'rad': (1.0, _dimension(A=1)),
+    'deg': (math.pi / 180, _dimension(A=1))
+})
+
+_UNIT_TOKEN = re.compile(r'\s*(?:(?P<number>-?\d+(?:\.\d+)?)|(?P<atom>[A-Za-z%]+)|(?P<operator>[*/^()]))')
+
+
+@lru_cache(maxsize=None)
+def parse_unit_expression(expression: str) -> Tuple[float, Tuple[Fraction, ...]]:
+    """
+    Parse a compound unit expression into its SI factor and dimension vector
+    
+    Supports products, quotients, powers and parentheses of the atomic units,
+    e.g. 'kN/m^2', 'N/mm^3', 'kN*m/rad', 'MPa^0.5' or 'kN/(m*s)'. Results are
+    cached, so repeated lookups of the same expression are free.
+    
+    Returns:
+        Tuple of (factor to SI, exponents over _BASE_DIMENSIONS)
+    """
+    tokens = []
+    position = 0
+    stripped = expression.rstrip()
+    while position < len(stripped):
+        match = _UNIT_TOKEN.match(stripped, position)
+        if not match:
+            raise ValueError(f"Invalid unit expression '{expression}' at position {position}")
+        tokens.append((match.lastgroup, match.group(match.lastgroup)))
+        position = match.end()
+    if not tokens:
+        raise ValueError("Empty unit expression")
+    
+    index = 0
+    
+    def peek():
+        return tokens[index] if index < len(tokens) else (None, None)
+    
+    def parse_product():
+        nonlocal index
+        factor, dimension = parse_power()
+        while peek()[1] in ('*', '/'):
+            operator = tokens[index][1]
+            index += 1
+            term_factor, term_dimension = parse_power()
+            if operator == '*':
+                factor *= term_factor
+                dimension = tuple(a + b for a, b in zip(dimension, term_dimension))
+            else:
+                factor /= term_factor
+                dimension = tuple(a - b for a, b in zip(dimension, term_dimension))
+        return factor, dimension
+    
+    def parse_power():
+        nonlocal index
+        factor, dimension = parse_atom()
+        if peek()[1] == '^':
+            index += 1
+            kind, value = peek()
+            if kind != 'number':
+                raise ValueError(f"Expected exponent after '^' in unit expression '{expression}'")
+            index += 1
+            exponent = Fraction(value)
+            factor = factor ** exponent.numerator if exponent.denominator == 1 else float(factor) ** float(exponent)
+            dimension = tuple(exponent * d for d in dimension)
+        return factor, dimension
+    
+    def parse_atom():
+        nonlocal index
+        kind, value = peek()
+        index += 1
+        if kind == 'atom':
+            if value not in _UNIT_ATOMS:
+                raise ValueError(f"Unknown unit '{value}' in unit expression '{expression}'")
+            factor, dimension = _UNIT_ATOMS[value]
+            # Exact rational arithmetic keeps e.g. mm^3 free of float round-off
+            return Fraction(repr(factor)), dimension
+        if kind == 'number' and value == '1':
+            return Fraction(1), _DIMENSIONLESS
+        if value == '(':
+            result = parse_product()
+            if peek()[1] != ')':
+                raise ValueError(f"Missing ')' in unit expression '{expression}'")
+            index += 1
+            return result
+        raise ValueError(f"Unexpected '{value}' in unit expression '{expression}'")
+    
+    factor, dimension = parse_product()
+    if index != len(tokens):
+        raise ValueError(f"Unexpected '{tokens[index][1]}' in unit expression '{expression}'")
+    return float(factor), dimension
+
 
 class FrescoUnits:
     """Essential unit converter for structural engineering"""
     
     def __init__(self):
-        self.__basic_units = {
-            'Length': {
-                'm': 1, 'cm': 0.01, 'mm': 0.001, 'in': 0.0254, 'ft': 0.3048
-            },
-            'Time': {
-                's': 1, 'min': 60, 'hr': 3600, 'day': 86400
-            },
-            'Mass': {
-                'kg': 1, 'g': 0.001, 'tonne': 1000, 'lb': 0.45359237
-            },
-            'Temperature': {'K': 1, 'C': 1, 'F': 1},
-            'Pressure': {
-                'Pa': 1, 'kPa': 1000, 'MPa': 1000000, 'GPa': 1000000000,
-                'N/mm^2': 1000000, 'psi': 6894.757293168360, 'ksi': 6894757.293168360
-            },
-            'Concentrated_Force': {
-                'N': 1, 'kN': 1000, 'MN': 1000000, 'lbf': 4.448221615260500, 'kip': 4448.221615260500
-            },
-            'Distributed_Force': {
-                'N/m': 1, 'kN/m': 1000, 'N/mm': 1000, 'kN/mm': 1000000,
-                'lbf/ft': 14.59390293720640, 
-                'kip/ft': 14593.90293720640
-            },
-            'Work': {
-                'J': 1, 'kJ': 1000, 'N*m': 1, 'kN*m': 1000, 'N*mm': 0.001, 'kN*mm': 1,
-                'lbf*in': 0.1129848290276170, 'lbf*ft': 1.355817948331400, 
-                'kip*in': 112.9848290276170, 'kip*ft': 1355.817948331400
-            },
-            'Density': {
-                'kg/m^3': 1, 'g/cm^3': 1000, 'lb/ft^3': 16.0185, 'pcf': 16.0185
-            },
-            'Strain': {
-                'strain': 1, 'percent': 0.01, '%': 0.01, 'ratio': 1
-            }
-        }
-        self.units = copy.deepcopy(self.__basic_units)
+        # Instances share the frozen registry and only keep their own overrides,
+        # copied on the first register_unit() call
+        self._overrides: Optional[Dict[str, Dict[str, float]]] = None
+        self._units = _BASIC_UNITS
+        self._factor_table = _BASIC_FACTORS
+        self._compound_factors: Dict[Tuple[str, str, str], Tuple[float, float, float]] = {}
+    
+    @property
+    def units(self) -> MappingProxyType:
+        """Read-only {unit_type: {unit: to_base_factor}} table including overrides"""
+        return self._units
+    
+    def register_unit(self, unit_type: str, unit: str, to_base_factor: float):
+        """
+        Register (or override) a unit for this converter only
+        
+        Args:
+            unit_type: Existing or new unit type (e.g. 'Length')
+            unit: Unit name (e.g. 'yd')
+            to_base_factor: Factor converting one unit into the base unit of unit_type
+        """
+        if unit_type == 'Temperature':
+            raise ValueError("Temperature units use affine conversions and cannot be registered")
+        
+        if self._overrides is None:
+            self._overrides = {}
+        self._overrides.setdefault(unit_type, {})[unit] = to_base_factor
+        
+        merged = {unit_type_name: dict(table) for unit_type_name, table in _BASIC_UNITS.items()}
+        for unit_type_name, table in self._overrides.items():
+            merged.setdefault(unit_type_name, {}).update(table)
+        self._units = _freeze_units(merged)
+        
+        # Drop cached pairs of the changed unit type, they are rebuilt on demand
+        self._factor_table = {key: factor for key, factor in self._factor_table.items() if key[0] != unit_type}
+        self._compound_factors.clear()
     
     def convert_temperature(self, from_value, from_unit, to_unit):
         if from_unit == to_unit:
@@ -68,109 +303,1382 @@ class FrescoUnits:
         else:
             return kelvin
     
-    def convert(self, from_value: float, unit_type: str, from_unit: str, to_unit: str, precision: int = 14) -> float:
-        if unit_type not in self.units:
-            raise KeyError(f"Unit type '{unit_type}' not recognized")
-        if from_unit not in self.units[unit_type]:
-            raise KeyError(f"From unit '{from_unit}' not recognized for unit type '{unit_type}'")
-        if to_unit not in self.units[unit_type]:
-            raise KeyError(f"To unit '{to_unit}' not recognized for unit type '{unit_type}'")
-        
-        if from_unit == to_unit:
-            return from_value
-        
-        if unit_type == 'Temperature':
-            result = self.convert_temperature(from_value, from_unit, to_unit)
-        else:
-            to_base_factor = self.units[unit_type][from_unit]
-            base_value = from_value * to_base_factor
-            from_base_factor = self.units[unit_type][to_unit]
-            result = base_value / from_base_factor
-        
-        return round(result, precision)
+    def get_conversion_factor(self, unit_type: str, from_unit: str, to_unit: str) -> Tuple[float, float, float]:
+        """
+        Get the (multiplier, divisor, offset) triple converting from_unit to to_unit
+        
+        Converted value = value * multiplier / divisor + offset, where multiplier
+        and divisor are the to-base and from-base factors of the unit table (kept
+        separate so results match convert() bit for bit). The offset is only
+        non-zero for Temperature. Every registered pair is precomputed in a flat
+        table, so a lookup is a single dict access.
+        """
+        key = (unit_type, from_unit, to_unit)
+        factor = self._factor_table.get(key) or self._compound_factors.get(key)
+        if factor is not None:
+            return factor
+        
+        units = self._units
+        if unit_type in units and from_unit in units[unit_type] and to_unit in units[unit_type]:
+            factor = _pair_factor(units, unit_type, from_unit, to_unit)
+        else:
+            factor = self._compound_factor(unit_type, from_unit, to_unit)
+        
+        # Only converters with overrides own a mutable table
+        if self._overrides is not None:
+            self._factor_table[key] = factor
+        else:
+            self._compound_factors[key] = factor
+        return factor
+    
+    def _compound_factor(self, unit_type: str, from_unit: str, to_unit: str) -> Tuple[float, float, float]:
+        """Factor between units outside the unit table, resolved by dimensional analysis"""
+        units = self._units
+        # 'Compound' (convert_expression) accepts any expression, other unit types must be registered
+        if unit_type != 'Compound' and unit_type not in units:
+            raise KeyError(f"Unit type '{unit_type}' not recognized")
+        expected_dimension = _UNIT_TYPE_DIMENSIONS.get(unit_type)
+        
+        for label, unit in (('From', from_unit), ('To', to_unit)):
+            if unit_type in units and unit in units[unit_type]:
+                continue
+            dimension = self._unit_dimension(unit)
+            if dimension is None:
+                raise KeyError(f"{label} unit '{unit}' not recognized for unit type '{unit_type}'")
+            if unit_type in units and dimension != expected_dimension:
+                raise KeyError(f"{label} unit '{unit}' not recognized for unit type '{unit_type}'")
+        
+        from_dimension = self._unit_dimension(from_unit)
+        to_dimension = self._unit_dimension(to_unit)
+        if from_dimension != to_dimension:
+            raise KeyError(f"Units '{from_unit}' and '{to_unit}' are not dimensionally consistent")
+        
+        return (self._unit_si_factor(unit_type, from_unit), self._unit_si_factor(unit_type, to_unit), 0.0)
+    
+    def _unit_dimension(self, unit: str) -> Optional[Tuple[Fraction, ...]]:
+        """Dimension vector of a unit expression, None if it cannot be parsed"""
+        if not isinstance(unit, str):
+            return None
+        try:
+            return parse_unit_expression(unit)[1]
+        except (ValueError, TypeError):
+            return None
+    
+    def _unit_si_factor(self, unit_type: str, unit: str) -> float:
+        """SI factor of a unit, taken from the unit table when listed there"""
+        if unit_type in self._units and unit in self._units[unit_type] and unit_type in _UNIT_TYPE_DIMENSIONS:
+            return self._units[unit_type][unit]
+        return parse_unit_expression(unit)[0]
+    
+    def is_valid_unit(self, unit_type: str, unit: str) -> bool:
+        """Check whether unit is listed for unit_type or is a compound unit of the same dimension"""
+        if unit_type in self._units and unit in self._units[unit_type]:
+            return True
+        expected_dimension = _UNIT_TYPE_DIMENSIONS.get(unit_type)
+        return expected_dimension is not None and self._unit_dimension(unit) == expected_dimension
+    
+    def convert_expression(self, from_value: float, from_unit: str, to_unit: str, precision: int = 14) -> float:
+        """
+        Convert between any two dimensionally consistent unit expressions
+        
+        Example: convert_expression(2.5, 'kN*m/rad', 'kip*in/rad')
+        """
+        return self.convert(from_value, 'Compound', from_unit, to_unit, precision)
+    
+    def convert_array(self, values, unit_type: str, from_unit: str, to_unit: str, precision: int = 14):
+        """
+        Convert a whole column of numeric values in one pass
+        
+        Args:
+            values: NumPy array or list/iterable of numbers
+            unit_type, from_unit, to_unit: Same as convert()
+            precision: Rounding digits applied to every result
+        
+        Returns:
+            NumPy array for array input, list otherwise
+        """
+        multiplier, divisor, offset = self.get_conversion_factor(unit_type, from_unit, to_unit)
+        
+        if np is not None and isinstance(values, np.ndarray):
+            if from_unit == to_unit:
+                return values.copy()
+            return np.round(values * multiplier / divisor + offset, precision)
+        
+        if from_unit == to_unit:
+            return list(values)
+        if offset:
+            return [round(value * multiplier / divisor + offset, precision) for value in values]
+        return [round(value * multiplier / divisor, precision) for value in values]
+    
+    def convert_column(self, column: List[Any], unit_type: str, from_unit: str, to_unit: str, precision: int = 14) -> List[Any]:
+        """
+        Convert the numeric values of a mixed column, leaving other values untouched
+        
+        Strings, None and other non-numeric values (e.g. 'none' placeholders) are
+        passed through so a database column can be converted as it is stored.
+        """
+        positions = [i for i, value in enumerate(column) if isinstance(value, (int, float)) and not isinstance(value, bool)]
+        converted = list(column)
+        for position, value in zip(positions, self.convert_array([column[i] for i in positions], unit_type, from_unit, to_unit, precision)):
+            converted[position] = value
+        return converted
+    
+    def convert(self, from_value: float, unit_type: str, from_unit: str, to_unit: str, precision: int = 14) -> float:
+        to_base_factor, from_base_factor, _ = self.get_conversion_factor(unit_type, from_unit, to_unit)
+        
+        if from_unit == to_unit:
+            return from_value
+        
+        if unit_type == 'Temperature':
+            result = self.convert_temperature(from_value, from_unit, to_unit)
+        else:
+            base_value = from_value * to_base_factor
+            result = base_value / from_base_factor
+        
+        return round(result, precision)
+    
+    def get_available_units(self, unit_type: str) -> List[str]:
+        return list(self.units.get(unit_type, {}).keys())
+    
+    def get_unit_types(self) -> List[str]:
+        return list(self.units.keys())
+
+
+# Rebar notation grammar, '+' separates bar groups:
+#   group := [count] '#' diameter ['@' spacing]      e.g. "3#20", "#10@150", "2#16@100"
+_REBAR_GROUP = re.compile(r'\s*(\d*)#(\d+(?:\.\d+)?)(?:@(\d+(?:\.\d+)?))?\s*')
+_DIGITS = frozenset('0123456789')
+
+
+class ReinforcementSyntaxError(ValueError):
+    """Malformed reinforcement notation, position is the index of the offending character"""
+    
+    def __init__(self, rebar_string: str, position: int, expected: str, field_name: Optional[str] = None):
+        self.rebar_string = rebar_string
+        self.position = position
+        self.expected = expected
+        self.field_name = field_name
+        
+        found = repr(rebar_string[position]) if position < len(rebar_string) else "end of string"
+        prefix = f"{field_name}: " if field_name else ""
+        super().__init__(f"{prefix}Invalid reinforcement '{rebar_string}' at position {position}: "
+                         f"expected {expected}, found {found}")
+    
+    def __reduce__(self):
+        # Rebuilt from its fields, so the error survives the trip back from worker processes
+        return self.__class__, (self.rebar_string, self.position, self.expected, self.field_name)
+
+
+def _reinforcement_syntax_error(rebar_string: str, start: int) -> ReinforcementSyntaxError:
+    """Locate the first character of the group starting at start that breaks the grammar"""
+    length = len(rebar_string)
+    
+    def skip(chars, position):
+        while position < length and rebar_string[position] in chars:
+            position += 1
+        return position
+    
+    def number(position, expected):
+        end = skip(_DIGITS, position)
+        if end == position:
+            return end, expected
+        if end < length and rebar_string[end] == '.':
+            fraction_end = skip(_DIGITS, end + 1)
+            if fraction_end == end + 1:
+                return fraction_end, "a digit after '.'"
+            end = fraction_end
+        return end, None
+    
+    group_start = skip(' \t\r\n\f\v', start)
+    position = skip(_DIGITS, group_start)
+    if position >= length or rebar_string[position] != '#':
+        return ReinforcementSyntaxError(rebar_string, position, "a bar count or '#'" if position == group_start else "'#'")
+    
+    position, expected = number(position + 1, "a bar diameter")
+    if expected:
+        return ReinforcementSyntaxError(rebar_string, position, expected)
+    if position < length and rebar_string[position] == '@':
+        position, expected = number(position + 1, "a bar spacing")
+        if expected:
+            return ReinforcementSyntaxError(rebar_string, position, expected)
+    
+    return ReinforcementSyntaxError(rebar_string, skip(' \t\r\n\f\v', position), "'+' or end of string")
+
+
+@lru_cache(maxsize=8192)
+def _tokenize_reinforcement(rebar_string: str) -> Tuple[Tuple[str, str, Optional[str]], ...]:
+    """
+    Split a reinforcement string into its bar groups
+    
+    Returns:
+        Tuple of (count_str, diameter_str, spacing_str) per group, count_str is
+        '' and spacing_str None when not given
+    
+    Raises:
+        ReinforcementSyntaxError: If the string does not follow the notation
+    """
+    groups = []
+    position = 0
+    while True:
+        match = _REBAR_GROUP.match(rebar_string, position)
+        if match is None:
+            raise _reinforcement_syntax_error(rebar_string, position)
+        groups.append(match.groups())
+        position = match.end()
+        if position == len(rebar_string):
+            return tuple(groups)
+        if rebar_string[position] != '+':
+            raise _reinforcement_syntax_error(rebar_string, match.start())
+        position += 1
+
+
+@lru_cache(maxsize=8192)
+def parse_reinforcement(rebar_string: str) -> Tuple[Tuple[int, float, Optional[float]], ...]:
+    """
+    Structured form of a reinforcement string like '4#20+2#16' or '2#8@150'
+    
+    Args:
+        rebar_string: Reinforcement notation, '+' separates bar groups
+    
+    Returns:
+        Tuple of (count, diameter, spacing) per bar group. count defaults to 1
+        and spacing is None when not given, an empty string has no groups.
+    
+    Raises:
+        ReinforcementSyntaxError: If the string does not follow the notation
+    """
+    if not rebar_string:
+        return ()
+    
+    return tuple(
+        (int(count_str) if count_str else 1, float(diameter_str), float(spacing_str) if spacing_str else None)
+        for count_str, diameter_str, spacing_str in _tokenize_reinforcement(rebar_string)
+    )
+
+
+class FrescoReinforcementParser:
+    """Smart reinforcement parser with dynamic reinforcement field names"""
+    
+    # Memoised conversions are dropped past this many distinct (string, from, to) keys
+    MAX_MEMOISED_CONVERSIONS = 65536
+    
+    def __init__(self, converter: FrescoUnits):
+        self.converter = converter
+        # (rebar_string, from_unit, to_unit) -> converted string, valid for the converter's current units
+        self._conversion_memo: Dict[Tuple[str, str, str], str] = {}
+        self._memo_units = converter.units
+    
+    def parse(self, rebar_string: str) -> Tuple[Tuple[int, float, Optional[float]], ...]:
+        """(count, diameter, spacing) per bar group, see parse_reinforcement"""
+        return parse_reinforcement(rebar_string)
+    
+    def validate(self, rebar_string: str, field_name: Optional[str] = None):
+        """
+        Check a reinforcement string against the notation
+        
+        Raises:
+            ReinforcementSyntaxError: With the field name and the offending position
+        """
+        try:
+            parse_reinforcement(rebar_string)
+        except ReinforcementSyntaxError as e:
+            raise ReinforcementSyntaxError(e.rebar_string, e.position, e.expected, field_name) from None
+    
+    def parse_and_convert_reinforcement(self, rebar_string: str, from_unit: str, to_unit: str) -> str:
+        """
+        Parse reinforcement string, convert embedded dimensions, and reconstruct
+        
+        Examples:
+        - "3#20+2#14" with mm->cm becomes "3#2.0+2#1.4"
+        - "#10@150+#8@100" with mm->cm becomes "#1.0@15.0+#0.8@10.0"
+        """
+        if not rebar_string or from_unit == to_unit:
+            return rebar_string
+        return self.convert_reinforcement_column([rebar_string], from_unit, to_unit)[0]
+    
+    def convert_reinforcement_column(self, rebar_strings: List[Any], from_unit: str, to_unit: str) -> List[Any]:
+        """
+        Convert a whole column of reinforcement strings
+        
+        Every distinct string is tokenised once, the diameters and spacings of
+        all of them are scaled in a single array conversion and re-rendered with
+        the usual :g formatting. Results are memoised per (string, from_unit,
+        to_unit) since many specimens share the same notation.
+        
+        Args:
+            rebar_strings: Column values, non-strings and empty strings are passed through
+            from_unit, to_unit: Length units of the embedded dimensions
+        
+        Returns:
+            List of converted values, malformed strings are returned unchanged
+        """
+        if from_unit == to_unit:
+            return list(rebar_strings)
+        
+        if self.converter.units is not self._memo_units or len(self._conversion_memo) > self.MAX_MEMOISED_CONVERSIONS:
+            # Units were registered on the converter (or the memo grew too large)
+            self._conversion_memo.clear()
+            self._memo_units = self.converter.units
+        memo = self._conversion_memo
+        
+        # Tokenise the distinct strings that are not memoised yet
+        pending = {}
+        for rebar_string in rebar_strings:
+            if not isinstance(rebar_string, str) or not rebar_string or rebar_string in pending \
+                    or (rebar_string, from_unit, to_unit) in memo:
+                continue
+            try:
+                pending[rebar_string] = _tokenize_reinforcement(rebar_string)
+            except ReinforcementSyntaxError as e:
+                logger.warning(f"Could not convert reinforcement '{rebar_string}': {e}")
+                memo[(rebar_string, from_unit, to_unit)] = rebar_string
+        
+        if pending:
+            # Diameter then optional spacing of every group, in string order
+            dimensions = []
+            for groups in pending.values():
+                for _, diameter_str, spacing_str in groups:
+                    dimensions.append(float(diameter_str))
+                    if spacing_str:
+                        dimensions.append(float(spacing_str))
+            
+            try:
+                converted_dimensions = iter(self.converter.convert_array(dimensions, 'Length', from_unit, to_unit))
+            except Exception as e:
+                for rebar_string in pending:
+                    logger.warning(f"Could not convert reinforcement '{rebar_string}': {e}")
+                return list(rebar_strings)
+            
+            for rebar_string, groups in pending.items():
+                converted_groups = []
+                for count_str, _, spacing_str in groups:
+                    result = f"{'#' if not count_str else count_str + '#'}{next(converted_dimensions):g}"
+                    if spacing_str:
+                        result += f"@{next(converted_dimensions):g}"
+                    converted_groups.append(result)
+                memo[(rebar_string, from_unit, to_unit)] = '+'.join(converted_groups)
+        
+        return [memo.get((value, from_unit, to_unit), value) if isinstance(value, str) else value
+                for value in rebar_strings]
+    
+    def is_reinforcement_field(self, field_name: str) -> bool:
+        """Check if a field contains reinforcement notation with embedded dimensions - DYNAMIC CHECK"""
+        return '_reinf' in field_name
+
+
+class FrescoConversionPlan:
+    """
+    Unit conversion steps compiled once for a (source units, target units) pair
+    
+    Every field whose unit differs between the two unit systems gets a step with
+    its numeric converter (fields with a unit_type) and its reinforcement string
+    converter ('_reinf' fields). Fields without a step are left untouched, so
+    applying a plan never re-derives field metadata per value.
+    """
+    
+    def __init__(self, converter: FrescoUnits, reinforcement_parser: FrescoReinforcementParser,
+                 field_unit_types: Dict[str, str], source_units: Dict[str, Optional[str]],
+                 target_units: Dict[str, Optional[str]]):
+        # field_name -> (from_unit, to_unit, (value_fn, column_fn) or None, (value_fn, column_fn) or None)
+        self.steps: Dict[str, Tuple[str, str, Any, Any]] = {}
+        
+        for field_name, to_unit in target_units.items():
+            from_unit = source_units.get(field_name, to_unit)
+            if from_unit is None or to_unit is None or from_unit == to_unit:
+                continue
+            
+            unit_type = field_unit_types.get(field_name)
+            numeric_step = self._compile_numeric(converter, unit_type, from_unit, to_unit) if unit_type else None
+            
+            reinforcement_step = None
+            if reinforcement_parser.is_reinforcement_field(field_name):
+                def reinforcement_value(value, from_unit=from_unit, to_unit=to_unit):
+                    return reinforcement_parser.parse_and_convert_reinforcement(value, from_unit, to_unit)
+                
+                def reinforcement_column(values, from_unit=from_unit, to_unit=to_unit):
+                    return reinforcement_parser.convert_reinforcement_column(values, from_unit, to_unit)
+                
+                reinforcement_step = (reinforcement_value, reinforcement_column)
+            
+            if numeric_step or reinforcement_step:
+                self.steps[field_name] = (from_unit, to_unit, numeric_step, reinforcement_step)
+    
+    @staticmethod
+    def _compile_numeric(converter: FrescoUnits, unit_type: str, from_unit: str, to_unit: str):
+        """Build (value_fn, column_fn) for a numeric field"""
+        try:
+            multiplier, divisor, _ = converter.get_conversion_factor(unit_type, from_unit, to_unit)
+        except KeyError as e:
+            error = e
+            def fail(value):
+                raise error
+            return fail, fail
+        
+        if unit_type == 'Temperature':
+            def value_fn(value):
+                return converter.convert(value, unit_type, from_unit, to_unit)
+        else:
+            def value_fn(value):
+                return round(value * multiplier / divisor, 14)
+        
+        def column_fn(values):
+            return converter.convert_array(values, unit_type, from_unit, to_unit)
+        
+        return value_fn, column_fn
+    
+    def apply_to_entry(self, entry_data: Dict[str, Any], show_conversion: bool = False) -> Tuple[int, int]:
+        """
+        Convert a single entry in place
+        
+        Returns:
+            Tuple of (numeric conversions, reinforcement conversions)
+        """
+        conversions_made = 0
+        reinforcement_conversions = 0
+        # Per-value messages are only formatted when someone listens at DEBUG level
+        show_conversion = show_conversion and logger.isEnabledFor(logging.DEBUG)
+        
+        for field_name, (from_unit, to_unit, numeric_step, reinforcement_step) in self.steps.items():
+            if field_name not in entry_data:
+                continue
+            value = entry_data[field_name]
+            
+            # Handle regular numeric fields
+            if isinstance(value, (int, float)) and numeric_step:
+                try:
+                    converted_value = numeric_step[0](value)
+                    entry_data[field_name] = converted_value
+                    conversions_made += 1
+                    
+                    if show_conversion:
+                        logger.debug(f"  {field_name}: {value} {from_unit} -> {converted_value:.3f} {to_unit}")
+                except Exception as e:
+                    logger.warning(f"  Could not convert {field_name}: {e}")
+            
+            # Handle reinforcement string conversion
+            elif isinstance(value, str) and reinforcement_step:
+                converted = self._convert_reinforcement(field_name, value, reinforcement_step, show_conversion)
+                if converted != value:
+                    entry_data[field_name] = converted
+                    reinforcement_conversions += 1
+        
+        return conversions_made, reinforcement_conversions
+    
+    def apply_to_entries(self, entries: Dict[Any, Dict[str, Any]], show_conversion: bool = False) -> Tuple[int, int]:
+        """
+        Convert many entries in place, numeric fields one column at a time
+        
+        Returns:
+            Tuple of (numeric conversions, reinforcement conversions)
+        """
+        conversions_made = 0
+        reinforcement_conversions = 0
+        show_conversion = show_conversion and logger.isEnabledFor(logging.DEBUG)
+        
+        for field_name, (from_unit, to_unit, numeric_step, reinforcement_step) in self.steps.items():
+            if numeric_step:
+                column = [(entry_id, entry_data[field_name]) for entry_id, entry_data in entries.items()
+                          if isinstance(entry_data.get(field_name), (int, float))]
+                if column:
+                    try:
+                        converted_column = numeric_step[1]([value for _, value in column])
+                    except Exception as e:
+                        logger.warning(f"  Could not convert {field_name}: {e}")
+                        converted_column = []
+                    
+                    for (entry_id, value), converted_value in zip(column, converted_column):
+                        entries[entry_id][field_name] = converted_value
+                        if show_conversion:
+                            logger.debug(f"  {field_name}: {value} {from_unit} -> {converted_value:.3f} {to_unit}")
+                    conversions_made += len(converted_column)
+            
+            if reinforcement_step:
+                column = [(entry_data, entry_data[field_name]) for entry_data in entries.values()
+                          if isinstance(entry_data.get(field_name), str)]
+                if column:
+                    try:
+                        converted_column = reinforcement_step[1]([value for _, value in column])
+                    except Exception as e:
+                        logger.warning(f"  Could not convert reinforcement {field_name}: {e}")
+                        converted_column = [value for _, value in column]
+                    
+                    for (entry_data, value), converted in zip(column, converted_column):
+                        if converted != value:
+                            entry_data[field_name] = converted
+                            reinforcement_conversions += 1
+                            if show_conversion:
+                                logger.debug(f"  {field_name}: '{value}' -> '{converted}'")
+        
+        return conversions_made, reinforcement_conversions
+    
+    def count_conversions(self, original: Dict[str, Any], converted: Dict[str, Any]) -> Tuple[int, int]:
+        """
+        Conversions apply_to_entry would report for an entry converted by apply_to_entries
+        
+        Returns:
+            Tuple of (numeric conversions, reinforcement conversions)
+        """
+        conversions_made = 0
+        reinforcement_conversions = 0
+        for field_name, (_, _, numeric_step, reinforcement_step) in self.steps.items():
+            value = original.get(field_name)
+            if isinstance(value, (int, float)) and numeric_step:
+                conversions_made += 1
+            elif isinstance(value, str) and reinforcement_step and converted.get(field_name) != value:
+                reinforcement_conversions += 1
+        return conversions_made, reinforcement_conversions
+    
+    @staticmethod
+    def _convert_reinforcement(field_name: str, value: str, reinforcement_step, show_conversion: bool) -> str:
+        """Convert one reinforcement string, returning it unchanged on failure"""
+        try:
+            converted_reinforcement = reinforcement_step[0](value)
+        except Exception as e:
+            logger.warning(f"  Could not convert reinforcement {field_name}: {e}")
+            return value
+        
+        if show_conversion and converted_reinforcement != value:
+            logger.debug(f"  {field_name}: '{value}' -> '{converted_reinforcement}'")
+        return converted_reinforcement
+
+
+class FrescoSchemaValidator:
+    """
+    Input checks compiled once from a field configuration
+    
+    Every field gets a prebuilt check that rejects type placeholders (e.g.
+    [float, "mm"]), units of the wrong unit type (a set lookup, with compound
+    units resolved by the converter) and malformed reinforcement notation.
+    """
+    
+    def __init__(self, field_config: Dict[str, Dict[str, Any]], converter: FrescoUnits,
+                 reinforcement_parser: FrescoReinforcementParser):
+        self.checks = {
+            field_name: self._compile_check(field_name, config.get('unit_type'), converter, reinforcement_parser)
+            for field_name, config in field_config.items()
+        }
+        # Fields outside the configuration are only checked for type placeholders
+        self.generic_check = self._compile_check(None, None, converter, reinforcement_parser)
+    
+    @staticmethod
+    def _compile_check(field_name: Optional[str], unit_type: Optional[str], converter: FrescoUnits,
+                       reinforcement_parser: FrescoReinforcementParser):
+        """
+        Build check(field_name, value, unit) for one field
+        
+        The check returns None for a valid value, ('object', reason) or
+        ('unit', reason) for a value that is dropped, and raises
+        ReinforcementSyntaxError for malformed reinforcement.
+        """
+        valid_units = frozenset(converter.units.get(unit_type, ())) if unit_type else None
+        is_reinforcement = field_name is not None and reinforcement_parser.is_reinforcement_field(field_name)
+        
+        def check(field_name, value, unit):
+            # Rule 1: Value Type Validation - remove type objects
+            if isinstance(value, type):
+                return 'object', f"{field_name} (type object '{value.__name__}')"
+            
+            # Rule 2: Unit Type Validation - remove wrong unit types
+            if unit and valid_units is not None and unit not in valid_units \
+                    and not converter.is_valid_unit(unit_type, unit):
+                return 'unit', f"{field_name} (invalid unit '{unit}' for {unit_type})"
+            
+            # Rule 3: Reinforcement notation - malformed strings reject the whole entry
+            if is_reinforcement and isinstance(value, str):
+                reinforcement_parser.validate(value, field_name)
+            return None
+        
+        return check
+
+
+# Members with derived reinforcement metrics: prefix -> (section dimension fields, cover field)
+_DERIVED_MEMBERS = {
+    'col': (('col_h', 'col_d'), 'col_cover'),
+    'bm': (('bm_h', 'bm_t'), 'bm_cover'),
+    'bbm': (('bbm_h', 'bbm_t'), 'bbm_cover'),
+}
+
+
+def _bar_count(rebar_string: str) -> int:
+    """Total number of bars of a reinforcement string"""
+    return sum(count for count, _, _ in parse_reinforcement(rebar_string))
+
+
+def _first_group(rebar_string: str) -> Tuple[int, float, Optional[float]]:
+    """(count, diameter, spacing) of the first bar group, the one the generators read"""
+    return parse_reinforcement(rebar_string)[0]
+
+
+def _inside(position: float, size: float, start: float, end: float) -> bool:
+    """Opening [position, position + size] lies within [start, end], openings of zero size are not checked"""
+    return not (size > 0) or (position >= start and position + size <= end)
+
+
+# Cross-field rules checked by FrescoDatabase.check_consistency, mirroring what the
+# CAD generators require: name -> (fields, predicate(*values) -> True when consistent, message[, severity]).
+# Values are read in the field_config units, a predicate raising counts as a violation.
+# Rules are 'error' (the generator fails) unless a 'warning' severity is given (the generator
+# skips that part of the model).
+CONSISTENCY_RULES = {
+    'frame_dimensions_positive': (
+        ('frm_h', 'frm_l', 'col_h', 'col_d', 'bm_h', 'bm_t'),
+        lambda *dims: all(dim > 0 for dim in dims),
+        "critical frame dimensions must be positive"),
+    'frame_dimensions_non_negative': (
+        ('bbm_h', 'bbm_t', 'slb_d', 'slb_h', 'col_ext', 'bm_ext', 'bbm_ext'),
+        lambda *dims: all(dim >= 0 for dim in dims),
+        "base beam, slab and extension dimensions must not be negative"),
+    'frame_opening_width': (
+        ('frm_l', 'col_h'),
+        lambda frm_l, col_h: frm_l - 2 * col_h > 0,
+        "columns leave no opening (frm_l - 2*col_h <= 0)"),
+    'frame_opening_height': (
+        ('frm_h', 'bm_h'),
+        lambda frm_h, bm_h: frm_h - bm_h > 0,
+        "beam leaves no opening (frm_h - bm_h <= 0)"),
+    'infill_interfaces_fit': (
+        ('inf_type', 'frm_l', 'col_h', 'frm_h', 'bm_h',
+         'inf_interface_left', 'inf_interface_right', 'inf_interface_bottom', 'inf_interface_top'),
+        lambda inf_type, frm_l, col_h, frm_h, bm_h, left, right, bottom, top: inf_type == 'none' or (
+            left + right < frm_l - 2 * col_h and bottom + top < frm_h - bm_h),
+        "infill interfaces are larger than the frame opening"),
+    'infill_bond_pattern': (
+        ('inf_type', 'inf_bnd_pat'),
+        lambda inf_type, inf_bnd_pat: inf_type == 'none' or inf_bnd_pat in ('running', 'stack'),
+        "infill bond pattern is not 'running' or 'stack', the infill is not modelled", 'warning'),
+    'infill_window_inside': (
+        ('inf_type', 'inf_opn_type', 'frm_l', 'col_h', 'frm_h', 'bm_h',
+         'inf_win_h', 'inf_win_v', 'inf_win_ph', 'inf_win_pv'),
+        lambda inf_type, inf_opn_type, frm_l, col_h, frm_h, bm_h, win_h, win_v, win_ph, win_pv:
+            inf_type == 'none' or inf_opn_type == 'none' or not (win_v > 0) or (
+                _inside(win_ph, win_h, 0, frm_l - 2 * col_h) and _inside(win_pv, win_v, 0, frm_h - bm_h)),
+        "window lies outside the infill"),
+    'infill_door_inside': (
+        ('inf_type', 'inf_opn_type', 'frm_l', 'col_h', 'frm_h', 'bm_h',
+         'inf_door_h', 'inf_door_v', 'inf_door_ph', 'inf_door_pv'),
+        lambda inf_type, inf_opn_type, frm_l, col_h, frm_h, bm_h, door_h, door_v, door_ph, door_pv:
+            inf_type == 'none' or inf_opn_type == 'none' or not (door_v > 0) or (
+                _inside(door_ph, door_h, 0, frm_l - 2 * col_h) and _inside(door_pv, door_v, 0, frm_h - bm_h)),
+        "door lies outside the infill"),
+    'bbm_reinforcement_width': (
+        ('bbm_t', 'bbm_cover', 'bbm_trans_crit_left_reinf'),
+        lambda bbm_t, bbm_cover, reinforcement: bbm_t - 2 * bbm_cover - _first_group(reinforcement)[1] > 0,
+        "base beam reinforcement has no width (bbm_t - 2*bbm_cover - hoop diameter <= 0)"),
+    'bbm_reinforcement_height': (
+        ('bbm_h', 'bbm_cover', 'bbm_trans_crit_left_reinf'),
+        lambda bbm_h, bbm_cover, reinforcement: bbm_h - 2 * bbm_cover - _first_group(reinforcement)[1] > 0,
+        "base beam reinforcement has no height (bbm_h - 2*bbm_cover - hoop diameter <= 0)"),
+    'steel_strength_order': (
+        ('fy', 'fu'),
+        lambda fy, fu: not (fy > 0 and fu > 0) or fu >= fy,
+        "steel ultimate strength fu is lower than yield strength fy"),
+}
+
+for _member, _transverse_fields in (
+        ('col', ('col_trans_crit_top_reinf', 'col_trans_crit_bot_reinf', 'col_trans_mid_reinf')),
+        ('bm', ('bm_trans_crit_left_reinf', 'bm_trans_crit_right_reinf', 'bm_trans_mid_reinf')),
+        ('bbm', ('bbm_trans_crit_left_reinf', 'bbm_trans_crit_right_reinf', 'bbm_trans_mid_reinf'))):
+    CONSISTENCY_RULES[f'{_member}_cover_positive'] = (
+        (f'{_member}_cover',), lambda cover: cover > 0, f"{_member}_cover must be positive")
+    CONSISTENCY_RULES[f'{_member}_transverse_reinforcement'] = (
+        _transverse_fields, lambda *reinforcement: all(parse_reinforcement(value) for value in reinforcement),
+        f"{_member} transverse reinforcement must be given and parseable")
+    CONSISTENCY_RULES[f'{_member}_corner_bars'] = (
+        (f'{_member}_long_reinf_corner',), lambda corner: _first_group(corner)[0] == 4,
+        f"{_member} needs exactly four corner bars in the first bar group")
+    CONSISTENCY_RULES[f'{_member}_mid_bars_even'] = (
+        (f'{_member}_long_reinf_mid',), lambda mid: _bar_count(mid) % 2 == 0,
+        f"{_member} middle bars must be an even number")
+del _member, _transverse_fields
+
+# Placeholder type objects of raw entries (e.g. [float, "Length"]) are written as {"$type": "float"} in catalogue files
+_CATALOGUE_TYPES = {placeholder.__name__: placeholder for placeholder in (float, int, str, bool, list, dict)}
+
+
+def _decode_catalogue_object(item: Dict[str, Any]) -> Any:
+    """json object_hook turning {"$type": name} back into the type object"""
+    if len(item) == 1 and "$type" in item:
+        if item["$type"] not in _CATALOGUE_TYPES:
+            raise ValueError(f"Unknown placeholder type '{item['$type']}'")
+        return _CATALOGUE_TYPES[item["$type"]]
+    return item
+
+
+def _encode_catalogue_value(value: Any) -> Any:
+    """Catalogue file form of a raw entry value"""
+    if isinstance(value, type):
+        return {"$type": value.__name__}
+    if isinstance(value, (list, tuple)):
+        return [_encode_catalogue_value(item) for item in value]
+    return value
+
+
+class FrescoCatalogue(Mapping):
+    """
+    Raw specimen entries stored as one JSON file per specimen plus a manifest
+    
+    Behaves like the {specimen_key: entry_data} dict it replaces, in manifest
+    order, but a specimen file is only read the first time it is accessed.
+    Entries keep the usual input conventions ([value, "unit"] pairs and
+    [float, "Length"] placeholders). refresh() and wait_for_changes() pick up
+    files edited on disk.
+    """
+    
+    MANIFEST = "manifest.json"
+    
+    def __init__(self, folder: str):
+        self.folder = folder
+        self._read_manifest()
+        self._loaded: Dict[str, Dict[str, Any]] = {}
+        # File name -> (mtime_ns, size) when last refreshed
+        self._stamps = self._file_stamps()
+    
+    def _read_manifest(self):
+        """
+        Read the specimen keys and files of the manifest
+        
+        Raises:
+            ValueError: If the manifest is not valid JSON or a specimen misses its key or file
+        """
+        manifest_path = os.path.join(self.folder, self.MANIFEST)
+        with open(manifest_path, encoding='utf-8') as f:
+            manifest = json.load(f)
+        
+        specimens = manifest.get("specimens") if isinstance(manifest, dict) else None
+        if not isinstance(specimens, list):
+            raise ValueError(f"{manifest_path}: 'specimens' list missing")
+        for position, specimen in enumerate(specimens):
+            if not (isinstance(specimen, dict) and isinstance(specimen.get("key"), str)
+                    and isinstance(specimen.get("file"), str)):
+                raise ValueError(f"{manifest_path}: specimen {position} needs a 'key' and a 'file'")
+        self._files = {specimen["key"]: specimen["file"] for specimen in specimens}
+    
+    def __getitem__(self, key: str) -> Dict[str, Any]:
+        entry_data = self._loaded.get(key)
+        if entry_data is None:
+            with open(self.file_path(key), encoding='utf-8') as f:
+                entry_data = self._loaded[key] = json.load(f, object_hook=_decode_catalogue_object)
+        return entry_data
+    
+    def __iter__(self):
+        return iter(self._files)
+    
+    def __len__(self) -> int:
+        return len(self._files)
+    
+    def __contains__(self, key) -> bool:
+        return key in self._files
+    
+    def file_path(self, key: str) -> str:
+        """Path of the data file of one specimen"""
+        return os.path.join(self.folder, self._files[key])
+    
+    def _file_stamps(self) -> Dict[str, Optional[Tuple[int, int]]]:
+        """(mtime_ns, size) of the manifest and every specimen file, None for missing files"""
+        stamps = {}
+        for file_name in (self.MANIFEST, *self._files.values()):
+            try:
+                stat = os.stat(os.path.join(self.folder, file_name))
+                stamps[file_name] = (stat.st_mtime_ns, stat.st_size)
+            except FileNotFoundError:
+                stamps[file_name] = None
+        return stamps
+    
+    def refresh(self) -> Set[str]:
+        """
+        Pick up the files changed on disk since the last refresh
+        
+        Re-reads the manifest if it changed and forgets loaded specimens whose
+        file changed, they are read again on next access.
+        
+        Returns:
+            Keys of the specimens added, removed or edited
+        
+        Raises:
+            ValueError: If the changed manifest is malformed, the previous specimen list is kept
+        """
+        old_files, old_stamps = self._files, self._stamps
+        stamps = self._file_stamps()
+        if stamps[self.MANIFEST] != old_stamps.get(self.MANIFEST):
+            # A malformed manifest is reported once, it is read again on its next save
+            self._stamps = stamps
+            self._read_manifest()
+            stamps = self._file_stamps()
+        self._stamps = stamps
+        
+        changed = {key for key in old_files.keys() | self._files.keys()
+                   if old_files.get(key) != self._files.get(key)
+                   or stamps.get(self._files.get(key)) != old_stamps.get(old_files.get(key))}
+        for key in changed:
+            self._loaded.pop(key, None)
+        return changed
+    
+    def wait_for_changes(self, interval: float = 0.2, debounce: float = 0.2,
+                         timeout: Optional[float] = None) -> Set[str]:
+        """
+        Block until specimen files change on disk, then refresh
+        
+        Files are polled every interval seconds. Once a change is seen the files
+        have to stay untouched for debounce seconds, so a burst of saves is
+        picked up as one change.
+        
+        Args:
+            interval: Seconds between polls
+            debounce: Seconds without further changes before refreshing
+            timeout: Give up after this many seconds, None waits forever
+        
+        Returns:
+            Keys of the specimens added, removed or edited, empty on timeout
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            stamps = self._file_stamps()
+            if stamps != self._stamps:
+                while True:
+                    time.sleep(debounce)
+                    settled = self._file_stamps()
+                    if settled == stamps:
+                        break
+                    stamps = settled
+                changed = self.refresh()
+                if changed:
+                    return changed
+            if deadline is not None and time.monotonic() >= deadline:
+                return set()
+            time.sleep(interval)
+    
+    @classmethod
+    def write(cls, entries: Dict[str, Dict[str, Any]], folder: str, subfolder: str = "specimens") -> 'FrescoCatalogue':
+        """
+        Write raw entries as a catalogue folder
+        
+        Args:
+            entries: specimen_key -> raw entry data
+            folder: Catalogue folder, the manifest is written there
+            subfolder: Folder for the specimen files, relative to folder
+        
+        Returns:
+            FrescoCatalogue reading the written files
+        """
+        os.makedirs(os.path.join(folder, subfolder), exist_ok=True)
+        specimens = []
+        for key, entry_data in entries.items():
+            file_name = f"{subfolder}/{key}.json"
+            # One field per line keeps specimen files readable and diffs small
+            lines = [f"    {json.dumps(field_name)}: {json.dumps(_encode_catalogue_value(value), ensure_ascii=False)}"
+                     for field_name, value in entry_data.items()]
+            with open(os.path.join(folder, file_name), 'w', encoding='utf-8', newline='\n') as f:
+                f.write("{\n" + ",\n".join(lines) + "\n}\n")
+            specimens.append({"key": key, "file": file_name})
+        
+        with open(os.path.join(folder, cls.MANIFEST), 'w', encoding='utf-8', newline='\n') as f:
+            json.dump({"specimens": specimens}, f, indent=2)
+            f.write("\n")
+        return cls(folder)
+
+
+class FrescoConvertedEntries(Mapping):
+    """
+    Read-only mapping of a database's entries converted to another unit system
+    
+    Entries are converted the first time they are accessed and memoised. A
+    memoised entry is reused until add_entry/update_entry/remove_entry or a
+    bulk change touches it, so repeated exports only convert what changed.
+    Reading an entry returns a shallow copy of the memoised one.
+    """
+    
+    def __init__(self, database: 'FrescoDatabase', units: Dict[str, Optional[str]]):
+        self._database = database
+        self._units = units
+        # entry_id -> (revision, converted entry, numeric conversions, reinforcement conversions)
+        self._memo: Dict[int, Tuple[Tuple[int, int], Dict[str, Any], int, int]] = {}
+    
+    def __getitem__(self, entry_id: int) -> Dict[str, Any]:
+        database = self._database
+        if entry_id not in database._data:
+            self._memo.pop(entry_id, None)
+            raise KeyError(entry_id)
+        
+        revision = database._entry_revision(entry_id)
+        memo = self._memo.get(entry_id)
+        if memo is None or memo[0] != revision:
+            entry_data = dict(database._data[entry_id])
+            plan = database._get_conversion_plan(database._storage_units, self._units)
+            conversions_made, reinforcement_conversions = plan.apply_to_entry(entry_data)
+            memo = self._memo[entry_id] = (revision, entry_data, conversions_made, reinforcement_conversions)
+        # A copy, so changing the returned entry does not alter the memoised one
+        return dict(memo[1])
+    
+    def __iter__(self):
+        return iter(self._database._data)
+    
+    def __len__(self) -> int:
+        return len(self._database._data)
+    
+    def __contains__(self, entry_id) -> bool:
+        return entry_id in self._database._data
+    
+    def prefetch(self) -> Tuple[int, int]:
+        """
+        Convert every entry that is not memoised yet in one column-wise pass
+        
+        Returns:
+            Tuple of (numeric conversions, reinforcement conversions) over all entries
+        """
+        database = self._database
+        stale = {}
+        for entry_id, entry_data in database._data.items():
+            memo = self._memo.get(entry_id)
+            if memo is None or memo[0] != database._entry_revision(entry_id):
+                stale[entry_id] = dict(entry_data)
+        
+        if stale:
+            plan = database._get_conversion_plan(database._storage_units, self._units)
+            plan.apply_to_entries(stale)
+            for entry_id, entry_data in stale.items():
+                counts = plan.count_conversions(database._data[entry_id], entry_data)
+                self._memo[entry_id] = (database._entry_revision(entry_id), entry_data) + counts
+        
+        return self.conversion_counts()
+    
+    def stream(self, entry_ids: Optional[List[int]] = None, chunk_size: int = 256,
+               result: Optional['FrescoResult'] = None):
+        """
+        Yield (entry_id, converted entry) without memoising, for exports
+        
+        Memoised entries are reused, the others are converted column-wise a
+        chunk at a time and dropped once yielded, so memory is bounded by
+        chunk_size whatever the size of the database.
+        
+        Args:
+            entry_ids: Entries in the order to yield them, default all in id order
+            chunk_size: Entries converted together
+            result: Conversion counts are added to it if given
+        """
+        database = self._database
+        entry_ids = sorted(database._data) if entry_ids is None else entry_ids
+        plan = database._get_conversion_plan(database._storage_units, self._units)
+        
+        for start in range(0, len(entry_ids), chunk_size):
+            chunk = entry_ids[start:start + chunk_size]
+            stale = {}
+            for entry_id in chunk:
+                memo = self._memo.get(entry_id)
+                if memo is None or memo[0] != database._entry_revision(entry_id):
+                    stale[entry_id] = dict(database._data[entry_id])
+            if stale:
+                plan.apply_to_entries(stale)
+            
+            for entry_id in chunk:
+                if entry_id in stale:
+                    entry_data = stale[entry_id]
+                    counts = plan.count_conversions(database._data[entry_id], entry_data) if result is not None else None
+                else:
+                    _, entry_data, *counts = self._memo[entry_id]
+                if result is not None:
+                    result.conversions += counts[0]
+                    result.reinforcement_conversions += counts[1]
+                yield entry_id, entry_data
+    
+    def conversion_counts(self) -> Tuple[int, int]:
+        """Numeric and reinforcement conversions behind the currently memoised entries"""
+        conversions_made = 0
+        reinforcement_conversions = 0
+        for entry_id, (_, _, numeric, reinforcement) in self._memo.items():
+            if entry_id in self._database._data:
+                conversions_made += numeric
+                reinforcement_conversions += reinforcement
+        return conversions_made, reinforcement_conversions
+
+
+class FrescoDatabaseView:
+    """
+    Read-only view of a FrescoDatabase in another unit system
+    
+    Exposes the read API of the database (data, field_units, get_info and the
+    exports) without copying or converting anything up front. Created with
+    FrescoDatabase.view(), always reflects the current database contents.
+    """
+    
+    def __init__(self, database: 'FrescoDatabase', units: Dict[str, Optional[str]]):
+        self._database = database
+        self.field_units = MappingProxyType(dict(units))
+        self.data = FrescoConvertedEntries(database, self.field_units)
+    
+    @property
+    def db_name(self) -> str:
+        return self._database.db_name
+    
+    @property
+    def field_config(self) -> Dict[str, Dict[str, Any]]:
+        return self._database.field_config
+    
+    @property
+    def field_unit_types(self) -> Dict[str, str]:
+        return self._database.field_unit_types
+    
+    @property
+    def converter(self) -> FrescoUnits:
+        return self._database.converter
+    
+    def get_info(self) -> Dict[str, Any]:
+        """Database information with the unit summary of this view"""
+        info = self._database.get_info()
+        info["unit_summary"] = self._database._unit_summary(self.field_units)
+        return info
+    
+    def view(self, units: Optional[Union[Dict[str, str], str]] = None) -> 'FrescoDatabaseView':
+        """Another view of the same database, partial units are taken relative to this view"""
+        if units is None:
+            return self
+        if isinstance(units, str):
+            return self._database.view(units)
+        return self._database.view({**self.field_units, **units})
+    
+    def export_json(self, filename: Optional[str] = None, compress: Optional[bool] = None) -> str:
+        """Export the database in this view's units (see FrescoDatabase.export_json)"""
+        return self._database.export_json(filename, dict(self.field_units), compress)
+    
+    def export_to_csv(self, filename: Optional[str] = None, include_units_header: bool = True,
+                      selected_fields: Optional[List[str]] = None) -> str:
+        """Export the database to CSV in this view's units (see FrescoDatabase.export_to_csv)"""
+        return self._database.export_to_csv(filename, dict(self.field_units), include_units_header, selected_fields)
+
+
+@dataclass
+class FrescoResult:
+    """
+    Outcome of a database operation
+    
+    Diagnostics are collected here whatever the logging level, so callers can
+    inspect what happened without parsing log output. Truthy when the
+    operation succeeded.
+    """
+    operation: str
+    entry_id: Optional[int] = None
+    success: bool = True
+    conversions: int = 0
+    reinforcement_conversions: int = 0
+    removed_fields: List[str] = field(default_factory=list)
+    filled_fields: int = 0
+    
+    def __bool__(self) -> bool:
+        return self.success
+
+
+@dataclass
+class FrescoConsistencyIssue:
+    """An entry breaking one of the CONSISTENCY_RULES"""
+    entry_id: int
+    rule: str
+    fields: Tuple[str, ...]
+    message: str
+    severity: str = 'error'
+
+
+class _LogRecordCollector(logging.Filter):
+    """
+    Logger filter holding back the records of threads inside _captured_log_records
+    
+    Records of a capturing thread are kept in that thread's list and dropped
+    from the handlers, other threads log as usual.
+    """
+    
+    def __init__(self):
+        super().__init__()
+        self._local = threading.local()
+    
+    @property
+    def records(self) -> Optional[List[logging.LogRecord]]:
+        """Records of the current thread's capture, None when it is not capturing"""
+        return getattr(self._local, 'records', None)
+    
+    @records.setter
+    def records(self, records: Optional[List[logging.LogRecord]]):
+        self._local.records = records
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        records = self.records
+        if records is None:
+            return True
+        # Format now so the record stays picklable for the process pool
+        record.msg = record.getMessage()
+        record.args = None
+        record.exc_info = None
+        records.append(record)
+        return False
+
+
+_log_record_collector = _LogRecordCollector()
+logger.addFilter(_log_record_collector)
+
+
+@contextlib.contextmanager
+def _captured_log_records():
+    """Hold back this module's log records in the current thread, yielding the list they are collected in"""
+    outer_records = _log_record_collector.records
+    records = _log_record_collector.records = []
+    try:
+        yield records
+    finally:
+        _log_record_collector.records = outer_records
+
+
+def _json_block(value: Any, level: int) -> str:
+    """json.dump(indent=2) text of value as it appears nested level deep"""
+    return json.dumps(value, indent=2).replace("\n", "\n" + "  " * level)
+
+
+def _csv_row(entry_id: int, entry_data: Dict[str, Any], fields: List[str]) -> List[Any]:
+    """One CSV row, complex values written as their string form and None as an empty cell"""
+    row = [entry_id]
+    for field_name in fields:
+        value = entry_data.get(field_name, '')
+        if isinstance(value, (list, dict)):
+            row.append(str(value))
+        elif value is None:
+            row.append('')
+        else:
+            row.append(value)
+    return row
+
+
+def _open_export(path: str, compress: bool, newline: Optional[str] = None):
+    """Open an export file for writing text, gzip-compressed if asked"""
+    if compress:
+        return gzip.open(path, 'wt', encoding='utf-8', compresslevel=6, newline=newline)
+    return open(path, 'w', encoding='utf-8', newline=newline)
+
+
+class _JsonExportWriter:
+    """Writes entries in the database file format as they arrive, identical to json.dump(indent=2)"""
+    
+    def __init__(self, path: str, config: Dict[str, Any], total_entries: int, compress: bool = False):
+        self.path = path
+        self._file = _open_export(path, compress)
+        self._total_entries = total_entries
+        self._first = True
+        self._file.write('{\n  "config": ' + _json_block(config, 1) + ',\n  "data": {')
+    
+    def write(self, entry_id: int, entry_data: Dict[str, Any]):
+        self._file.write(('\n' if self._first else ',\n') + f'    {json.dumps(str(entry_id))}: ' + _json_block(entry_data, 2))
+        self._first = False
+    
+    def close(self):
+        self._file.write(('}' if self._first else '\n  }') + f',\n  "total_entries": {self._total_entries}\n}}')
+        self._file.close()
+
+
+class _JsonLinesExportWriter:
+    """One JSON object per line and entry, with entry_id as its first key"""
+    
+    def __init__(self, path: str, compress: bool = False):
+        self.path = path
+        self._file = _open_export(path, compress)
+    
+    def write(self, entry_id: int, entry_data: Dict[str, Any]):
+        self._file.write(json.dumps({"entry_id": entry_id, **entry_data}) + "\n")
+    
+    def close(self):
+        self._file.close()
+
+
+class _CsvExportWriter:
+    """CSV rows with the entry_id/field header and an optional units row"""
+    
+    def __init__(self, path: str, fields: List[str], units: Dict[str, Optional[str]], include_units_header: bool = True):
+        self.path = path
+        self._fields = fields
+        self._file = open(path, 'w', newline='', encoding='utf-8')
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(['entry_id'] + fields)
+        if include_units_header:
+            # First column for entry_id
+            self._writer.writerow(['ID'] + [units.get(field_name) or '' for field_name in fields])
+    
+    def write(self, entry_id: int, entry_data: Dict[str, Any]):
+        self._writer.writerow(_csv_row(entry_id, entry_data, self._fields))
+    
+    def write_many(self, entries):
+        """Write (entry_id, entry) pairs, formatting each row as the csv writer consumes it"""
+        fields = self._fields
+        self._writer.writerows(_csv_row(entry_id, entry_data, fields) for entry_id, entry_data in entries)
+    
+    def close(self):
+        self._file.close()
+
+
+class _ColumnsExportWriter:
+    """Column-oriented JSON: {"field_units": ..., "columns": {"entry_id": [...], field: [...]}}"""
+    
+    def __init__(self, path: str, fields: List[str], units: Dict[str, Optional[str]], compress: bool = False):
+        self.path = path
+        self._compress = compress
+        self._units = {field_name: units.get(field_name) for field_name in fields}
+        self._columns: Dict[str, List[Any]] = {field_name: [] for field_name in ['entry_id'] + fields}
     
-    def get_available_units(self, unit_type: str) -> List[str]:
-        return list(self.units.get(unit_type, {}).keys())
+    def write(self, entry_id: int, entry_data: Dict[str, Any]):
+        for field_name, column in self._columns.items():
+            column.append(entry_id if field_name == 'entry_id' else entry_data.get(field_name))
     
-    def get_unit_types(self) -> List[str]:
-        return list(self.units.keys())
+    def close(self):
+        # A column is only complete once every entry was seen
+        with _open_export(self.path, self._compress) as f:
+            json.dump({"field_units": self._units, "columns": self._columns}, f)
 
 
-class FrescoReinforcementParser:
-    """Smart reinforcement parser with dynamic reinforcement field names"""
+# Text fields holding one of a few fixed options, dictionary-encoded in typed columnar exports
+CATEGORICAL_FIELDS = frozenset({
+    'inf_type', 'inf_opn_type', 'inf_bnd_pat', 'inf_inff_intfc', 'inf_mortar_type',
+    'inp_loading_protocol', 'inp_cyclic_repetition', 'inp_cyclic_protocol',
+    'oop_loading_protocol', 'oop_cyclic_repetition', 'oop_cyclic_protocol',
+})
+
+
+def _field_data_type(config: Dict[str, Any]) -> str:
+    """data_type of a field_config entry, fields without one are float with a unit type and str otherwise"""
+    return config.get('data_type', 'float' if config.get('unit_type') else 'str')
+
+
+def _typed_number(value: Any) -> Optional[Union[int, float]]:
+    """Numeric value of a typed column cell, None for missing and non-numeric values"""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return value
+    return None
+
+
+class _TypedColumnsExportWriter(_ColumnsExportWriter):
+    """
+    Base of the typed columnar writers, columns are typed from field_config data_type
     
-    def __init__(self, converter: FrescoUnits):
-        self.converter = converter
+    Cells that do not fit their column type (e.g. text in a numeric field) are
+    written as missing and counted in dropped_values.
+    """
     
-    def parse_and_convert_reinforcement(self, rebar_string: str, from_unit: str, to_unit: str) -> str:
-        """
-        Parse reinforcement string, convert embedded dimensions, and reconstruct
-        
-        Examples:
-        - "3#20+2#14" with mm->cm becomes "3#2.0+2#1.4"
-        - "#10@150+#8@100" with mm->cm becomes "#1.0@15.0+#0.8@10.0"
-        """
-        if not rebar_string or from_unit == to_unit:
-            return rebar_string
-        
-        try:
-            # Handle compound reinforcement (split by +)
-            if '+' in rebar_string:
-                parts = [part.strip() for part in rebar_string.split('+')]
-                converted_parts = []
-                for part in parts:
-                    converted_part = self._convert_single_reinforcement(part, from_unit, to_unit)
-                    converted_parts.append(converted_part)
-                return '+'.join(converted_parts)
-            else:
-                return self._convert_single_reinforcement(rebar_string, from_unit, to_unit)
-        
-        except Exception as e:
-            print(f"Warning: Could not convert reinforcement '{rebar_string}': {e}")
-            return rebar_string
+    def __init__(self, path: str, fields: List[str], units: Dict[str, Optional[str]],
+                 field_config: Dict[str, Dict[str, Any]], metadata: Dict[str, Any], compress: bool = False):
+        super().__init__(path, fields, units, compress)
+        self._data_types = {field_name: _field_data_type(field_config[field_name]) for field_name in fields}
+        self._data_types['entry_id'] = 'int'
+        self._metadata = metadata
+        self.dropped_values = 0
     
-    def _convert_single_reinforcement(self, rebar_string: str, from_unit: str, to_unit: str) -> str:
-        """Convert a single reinforcement notation"""
-        import re
-        
-        # Pattern to match reinforcement notation
-        # Captures: count, diameter, spacing (optional)
-        # Examples: "3#20", "#10@150", "2#16@100"
-        pattern = r'(\d*)#(\d+(?:\.\d+)?)(?:@(\d+(?:\.\d+)?))?'
-        
-        def convert_match(match):
-            count_str, diameter_str, spacing_str = match.groups()
-            
-            # Convert diameter
-            diameter = float(diameter_str)
-            converted_diameter = self.converter.convert(diameter, 'Length', from_unit, to_unit)
-            
-            # Build result
-            result = f"{'#' if not count_str else count_str + '#'}{converted_diameter:g}"
-            
-            # Convert spacing if present
-            if spacing_str:
-                spacing = float(spacing_str)
-                converted_spacing = self.converter.convert(spacing, 'Length', from_unit, to_unit)
-                result += f"@{converted_spacing:g}"
+    def _numbers(self, field_name: str) -> List[Optional[Union[int, float]]]:
+        values = self._columns[field_name]
+        numbers = [_typed_number(value) for value in values]
+        self.dropped_values += sum(1 for value, number in zip(values, numbers) if number is None and value is not None)
+        return numbers
+    
+    def _integers(self, field_name: str) -> List[Optional[int]]:
+        """Cells of an int column, NaN, infinite and fractional numbers are dropped"""
+        integers = []
+        for number in self._numbers(field_name):
+            if number is not None and not (isinstance(number, int) or
+                                           (math.isfinite(number) and number.is_integer())):
+                self.dropped_values += 1
+                number = None
+            integers.append(None if number is None else int(number))
+        return integers
+    
+    def _texts(self, field_name: str) -> List[Optional[str]]:
+        return [None if value is None else str(value) for value in self._columns[field_name]]
+
+
+class _ParquetExportWriter(_TypedColumnsExportWriter):
+    """Parquet file through pyarrow, units as field metadata and categorical fields as dictionaries"""
+    
+    def close(self):
+        arrays = []
+        schema_fields = []
+        for field_name in self._columns:
+            data_type = self._data_types[field_name]
+            if data_type == 'float':
+                array = pa.array([None if number is None else float(number) for number in self._numbers(field_name)],
+                                 pa.float64())
+            elif data_type == 'int':
+                array = pa.array(self._integers(field_name), pa.int64())
+            else:
+                array = pa.array(self._texts(field_name), pa.string())
+                if field_name in CATEGORICAL_FIELDS:
+                    array = array.dictionary_encode()
             
-            return result
-        
-        # Replace all matches in the string
-        converted = re.sub(pattern, convert_match, rebar_string)
-        return converted
+            field_metadata = {"data_type": data_type}
+            if self._units.get(field_name):
+                field_metadata["unit"] = self._units[field_name]
+            arrays.append(array)
+            schema_fields.append(pa.field(field_name, array.type, metadata=field_metadata))
+        
+        schema = pa.schema(schema_fields, metadata={"fresco": json.dumps(self._metadata)})
+        pq.write_table(pa.Table.from_arrays(arrays, schema=schema), self.path,
+                       compression='zstd' if self._compress else 'snappy')
+
+
+class _NpzExportWriter(_TypedColumnsExportWriter):
+    """
+    NumPy .npz bundle, one array per field
     
-    def is_reinforcement_field(self, field_name: str) -> bool:
-        """Check if a field contains reinforcement notation with embedded dimensions - DYNAMIC CHECK"""
-        return '_reinf' in field_name
+    float fields are float64 with NaN for missing values, int fields int64
+    (float64 when values are missing), categorical fields int32 codes into a
+    "<field>__categories" array (-1 when missing) and other text fields
+    unicode arrays. "__metadata__" holds the units, data types and export
+    metadata as JSON.
+    """
+    
+    def close(self):
+        arrays = {}
+        for field_name in self._columns:
+            data_type = self._data_types[field_name]
+            if data_type in ('float', 'int'):
+                numbers = self._integers(field_name) if data_type == 'int' else self._numbers(field_name)
+                if data_type == 'int' and None not in numbers:
+                    arrays[field_name] = np.array(numbers, dtype=np.int64)
+                else:
+                    arrays[field_name] = np.array([math.nan if number is None else number for number in numbers],
+                                                  dtype=np.float64)
+            elif field_name in CATEGORICAL_FIELDS:
+                texts = self._texts(field_name)
+                categories = sorted({text for text in texts if text is not None})
+                codes = {category: code for code, category in enumerate(categories)}
+                arrays[field_name] = np.array([-1 if text is None else codes[text] for text in texts], dtype=np.int32)
+                arrays[f"{field_name}__categories"] = np.array(categories, dtype=str)
+            else:
+                arrays[field_name] = np.array(['' if text is None else text for text in self._texts(field_name)],
+                                              dtype=str)
+        
+        metadata = {
+            **self._metadata,
+            "field_units": self._units,
+            "data_types": self._data_types,
+            "categorical": sorted(CATEGORICAL_FIELDS & set(self._columns)),
+        }
+        arrays["__metadata__"] = np.array(json.dumps(metadata))
+        (np.savez_compressed if self._compress else np.savez)(self.path, **arrays)
+
+
+# Formats of FrescoDatabase.export_all: name -> file extension (".gz" is added to compressed JSON files).
+# 'columnar' is 'parquet' when pyarrow is installed and 'npz' otherwise.
+EXPORT_FORMATS = {
+    'json': '.json',
+    'csv': '.csv',
+    'jsonl': '.jsonl',
+    'columns': '.columns.json',
+    'parquet': '.parquet',
+    'npz': '.npz',
+}
 
 
 class FrescoDatabase:
     """Unified structural database - reinforcement fields work like any other field"""
     
+    # Unit systems whose converted views are kept by view()
+    MAX_UNIT_VIEWS = 4
+    # Version of the manifest and patch files of export_manifest/export_patch
+    DELTA_FORMAT_VERSION = 1
+    
     def __init__(self, db_name: str, field_config:Dict[str, Dict[str, Any]] = RCF_FIELD_CONFIG, empty_field_config:Dict[str, Dict[str, Any]] = RCF_DB_EMPTY_FIELDS, 
                  auto_save:bool=True, auto_back_up:bool=True, compress_db:bool=True,
-                 show_conversion = True, show_invalid_object = True, show_invalid_unit = True):
+                 show_conversion = True, show_invalid_object = True, show_invalid_unit = True,
+                 lossless_units: bool = False):
         self.db_name = db_name
         self.auto_save = auto_save
         self.auto_back_up = auto_back_up
@@ -178,8 +1686,9 @@ class FrescoDatabase:
         self.show_conversion = show_conversion
         self.show_invalid_object = show_invalid_object
         self.show_invalid_unit = show_invalid_unit
+        self.lossless_units = lossless_units
 
-        self.data: Dict[int, Dict[str, Any]] = {}
+        self._data: Dict[int, Dict[str, Any]] = {}
         self.converter = FrescoUnits()
         self.reinforcement_parser = FrescoReinforcementParser(self.converter)
         
@@ -190,13 +1699,34 @@ class FrescoDatabase:
         # Extract convenience mappings
         self.field_units = {field: config['unit'] for field, config in self.field_config.items()}
         self.field_unit_types = {field: config['unit_type'] for field, config in self.field_config.items() if config['unit_type']}
+        self.validator = FrescoSchemaValidator(self.field_config, self.converter, self.reinforcement_parser)
+        self._default_entries: Dict[Tuple[tuple, tuple], Dict[str, Any]] = {}
+        # entry_id -> content hash of the raw entry it was last synced from (see sync_entries)
+        self._source_hashes: Dict[int, str] = {}
+        self._conversion_plans: Dict[Tuple[tuple, tuple], FrescoConversionPlan] = {}
+        
+        # Lossless mode: entries stay in the canonical units, other unit systems are derived views
+        self._canonical_units: Optional[Dict[str, Optional[str]]] = None
+        # Unit views handed out by view(), least recently used first, plus revisions telling them which entries changed
+        self._views: Dict[tuple, FrescoDatabaseView] = {}
+        self._data_revision = 0
+        self._entry_revisions: Dict[int, int] = {}
+        # entry_id -> {reinforcement field: ((count, diameter, spacing), ...)} of the stored strings
+        self._parsed_reinforcement: Dict[int, Dict[str, Tuple[Tuple[int, float, Optional[float]], ...]]] = {}
+        # Derived metric -> {entry_id: value}, and (field, unit) -> sorted (values, entry_ids) for select()
+        self._derived_columns: Dict[str, Dict[int, Optional[float]]] = {}
+        self._field_indexes: Dict[Tuple[str, Optional[str]], Tuple[List[float], List[int]]] = {}
+        # (section dimension units, derived_field_units) of the last derived_field_units call
+        self._derived_units_cache: Optional[Tuple[tuple, Dict[str, Optional[str]]]] = None
         
         self.version = "1.0"
         self.created_date = datetime.now().isoformat()
         self.last_modified = datetime.now().isoformat()
         
         self._load_if_exists()
-        print(f"Database '{db_name}' initialized with {len(self.data)} entries")
+        if self.lossless_units and self._canonical_units is None:
+            self._canonical_units = dict(self.field_units)
+        logger.info(f"Database '{db_name}' initialized with {len(self.data)} entries")
 
         if self.data and self.auto_back_up:
             json_file = f"{self.db_name}.json"
@@ -204,8 +1734,413 @@ class FrescoDatabase:
             json_backup = self._create_backup(json_file)
             
             if json_backup:
-                print(f"JSON backup: {json_backup}")
+                logger.info(f"JSON backup: {json_backup}")
+    
+    @property
+    def data(self) -> Dict[int, Dict[str, Any]]:
+        """
+        Entries in the current field_units
+        
+        In lossless mode the stored entries keep their canonical units and this
+        returns a read-only view converted to field_units. Modify entries through
+        add_entry/update_entry/remove_entry.
+        """
+        if self._canonical_units is None or self._canonical_units == self.field_units:
+            return self._data
+        return self.view().data
+    
+    @data.setter
+    def data(self, entries: Dict[int, Dict[str, Any]]):
+        self._data = entries
+        self._data_changed()
+    
+    @property
+    def _storage_units(self) -> Dict[str, Optional[str]]:
+        """Units the stored entries are kept in"""
+        return self._canonical_units if self._canonical_units is not None else self.field_units
+    
+    def view(self, units: Optional[Union[Dict[str, str], str]] = None) -> FrescoDatabaseView:
+        """
+        Read-only view of the database in another unit system
+        
+        Nothing is converted until an entry is read, converted entries are
+        memoised and refreshed only when they change. Views of the last
+        MAX_UNIT_VIEWS unit systems used are cached.
+        
+        Args:
+            units: field -> unit dict (missing fields keep their current unit),
+                a UNIT_SYSTEM_PRESETS name, or None for the current field_units
+        
+        Returns:
+            FrescoDatabaseView with data, field_units, get_info() and the exports
+        """
+        units = dict(self.field_units) if units is None else self._resolve_target_units(units)
+        key = tuple(units.items())
+        view = self._views.pop(key, None)
+        if view is None:
+            view = FrescoDatabaseView(self, units)
+            if len(self._views) >= self.MAX_UNIT_VIEWS:
+                del self._views[next(iter(self._views))]
+        self._views[key] = view
+        return view
+    
+    def _entry_revision(self, entry_id: int) -> Tuple[int, int]:
+        """Revision of one stored entry, compared by views to reuse converted entries"""
+        return self._data_revision, self._entry_revisions.get(entry_id, 0)
+    
+    def _entry_changed(self, entry_id: int):
+        """Mark one entry as added, updated or removed for the unit views and re-parse its reinforcement"""
+        self._entry_revisions[entry_id] = self._entry_revisions.get(entry_id, 0) + 1
+        self._source_hashes.pop(entry_id, None)
+        self._parsed_reinforcement.pop(entry_id, None)
+        for column in self._derived_columns.values():
+            column.pop(entry_id, None)
+        self._field_indexes.clear()
+        if entry_id in self._data:
+            self._parse_entry_reinforcement(entry_id)
+    
+    def _data_changed(self):
+        """Mark every entry as changed, after the stored data was replaced or converted"""
+        self._data_revision += 1
+        self._entry_revisions.clear()
+        self._parsed_reinforcement.clear()
+        self._derived_columns.clear()
+        self._field_indexes.clear()
+    
+    def _parse_entry_reinforcement(self, entry_id: int) -> Dict[str, Tuple[Tuple[int, float, Optional[float]], ...]]:
+        """Parse and cache the reinforcement fields of one stored entry, malformed strings are left out"""
+        parsed = {}
+        for field_name, value in self._data[entry_id].items():
+            if isinstance(value, str) and self.reinforcement_parser.is_reinforcement_field(field_name):
+                try:
+                    parsed[field_name] = self.reinforcement_parser.parse(value)
+                except ReinforcementSyntaxError:
+                    continue
+        self._parsed_reinforcement[entry_id] = parsed
+        return parsed
+    
+    def get_reinforcement(self, entry_id: int, field_name: str) -> Tuple[Tuple[int, float, Optional[float]], ...]:
+        """
+        Structured form of a reinforcement field
+        
+        Entries are parsed once when they are added or updated, later calls
+        reuse the parsed form.
+        
+        Args:
+            entry_id: Entry to read
+            field_name: Reinforcement field, e.g. 'col_long_reinf_top'
+        
+        Returns:
+            Tuple of (count, diameter, spacing) per bar group in the field's
+            current unit, spacing is None when not given
+        
+        Raises:
+            ReinforcementSyntaxError: If the stored string is malformed
+        """
+        if self.data is not self._data:
+            # Lossless view in other units - parse the converted string
+            value = self.data[entry_id][field_name]
+            return self.reinforcement_parser.parse(value) if isinstance(value, str) else ()
+        
+        parsed = self._parsed_reinforcement.get(entry_id)
+        if parsed is None:
+            parsed = self._parse_entry_reinforcement(entry_id)
+        if field_name not in parsed:
+            # Not a reinforcement string, or malformed data loaded from an older file
+            value = self._data[entry_id][field_name]
+            if isinstance(value, str) and self.reinforcement_parser.is_reinforcement_field(field_name):
+                self.reinforcement_parser.validate(value, field_name)
+            return ()
+        return parsed[field_name]
+    
+    @property
+    def derived_field_units(self) -> Dict[str, Optional[str]]:
+        """
+        Derived reinforcement metrics and their units
+        
+        For every member (col, bm, bbm):
+        - {member}_long_steel_area: total area of the longitudinal bars
+        - {member}_long_ratio: longitudinal steel area over the gross section
+        - {member}_trans_*_ratio: volumetric ratio of the rectangular hoops of
+          each transverse reinforcement field (e.g. col_trans_mid_ratio)
+        
+        Metrics are computed in the stored units, areas in the square of the
+        section dimension unit and ratios dimensionless (None).
+        """
+        return dict(self._derived_units())
+    
+    def _derived_units(self) -> Dict[str, Optional[str]]:
+        """derived_field_units, built once per set of section dimension units"""
+        storage_units = self._storage_units
+        key = tuple(storage_units.get(dimension_field) for (dimension_field, _), _ in _DERIVED_MEMBERS.values())
+        if self._derived_units_cache is not None and self._derived_units_cache[0] == key:
+            return self._derived_units_cache[1]
+        
+        derived_units = {}
+        for member, ((dimension_field, _), _) in _DERIVED_MEMBERS.items():
+            derived_units[f"{member}_long_steel_area"] = f"{storage_units.get(dimension_field)}^2"
+            derived_units[f"{member}_long_ratio"] = None
+            for field_name in self.field_config:
+                if field_name.startswith(f"{member}_trans_") and field_name.endswith("_reinf"):
+                    derived_units[f"{field_name[:-len('_reinf')]}_ratio"] = None
+        self._derived_units_cache = (key, derived_units)
+        return derived_units
+    
+    def get_derived_column(self, field_name: str) -> Dict[int, Optional[float]]:
+        """
+        Values of a derived metric for all entries (see derived_field_units)
+        
+        Entries are computed column-wise from the parsed reinforcement and the
+        section geometry, cached, and recomputed only after they change.
+        
+        Returns:
+            Dict of entry_id -> value, None where the inputs are missing
+        """
+        derived_units = self._derived_units()
+        if field_name not in derived_units:
+            raise KeyError(f"Unknown derived field '{field_name}'. Available: {list(derived_units.keys())}")
+        
+        column = self._derived_columns.setdefault(field_name, {})
+        stale = [entry_id for entry_id in self._data if entry_id not in column]
+        if stale:
+            member = field_name.split('_', 1)[0]
+            for metric_name, values in self._compute_member_metrics(member, stale).items():
+                self._derived_columns.setdefault(metric_name, {}).update(zip(stale, values))
+        
+        if len(column) != len(self._data):
+            # Drop entries that were removed since the column was filled
+            for entry_id in [entry_id for entry_id in column if entry_id not in self._data]:
+                column.pop(entry_id)
+        return column
+    
+    def _compute_member_metrics(self, member: str, entry_ids: List[int]) -> Dict[str, List[Optional[float]]]:
+        """All derived metrics of one member for the given entries, one column at a time"""
+        (height_field, width_field), cover_field = _DERIVED_MEMBERS[member]
+        storage_units = self._storage_units
+        section_unit = storage_units.get(height_field)
+        
+        def column(field_name):
+            # Stored numbers converted to the section dimension unit
+            multiplier, divisor, _ = self.converter.get_conversion_factor('Length', storage_units.get(field_name) or section_unit, section_unit)
+            values = []
+            for entry_id in entry_ids:
+                value = self._data[entry_id].get(field_name)
+                values.append(value * multiplier / divisor if isinstance(value, (int, float)) and not isinstance(value, bool) else None)
+            return values
+        
+        def reinforcement_column(field_name):
+            # (count, diameter, spacing) groups with lengths in the section dimension unit
+            multiplier, divisor, _ = self.converter.get_conversion_factor('Length', storage_units.get(field_name) or section_unit, section_unit)
+            scale = multiplier / divisor
+            groups_column = []
+            for entry_id in entry_ids:
+                parsed = self._parsed_reinforcement.get(entry_id)
+                if parsed is None:
+                    parsed = self._parse_entry_reinforcement(entry_id)
+                groups = parsed.get(field_name)
+                groups_column.append(None if groups is None else [
+                    (count, diameter * scale, spacing * scale if spacing is not None else None)
+                    for count, diameter, spacing in groups
+                ])
+            return groups_column
+        
+        heights = column(height_field)
+        widths = column(width_field)
+        covers = column(cover_field)
+        
+        # Longitudinal steel area and ratio
+        long_fields = [field_name for field_name in self.field_config
+                       if field_name.startswith(f"{member}_long_reinf_")]
+        areas = [None] * len(entry_ids)
+        for groups_column in map(reinforcement_column, long_fields):
+            for i, groups in enumerate(groups_column):
+                if groups is not None:
+                    areas[i] = (areas[i] or 0.0) + sum(count * math.pi * diameter ** 2 / 4 for count, diameter, _ in groups)
+        
+        metrics = {
+            f"{member}_long_steel_area": areas,
+            f"{member}_long_ratio": [
+                area / (height * width) if area is not None and height and width else None
+                for area, height, width in zip(areas, heights, widths)
+            ],
+        }
+        
+        # Volumetric ratio of rectangular hoops: bar area x hoop perimeter / (core area x spacing).
+        # As in RCFrameGenerator a count above 0 means one hoop at each spacing, not a number of hoops
+        cores = [
+            (height - 2 * cover, width - 2 * cover)
+            if height is not None and width is not None and cover is not None and height - 2 * cover > 0 and width - 2 * cover > 0
+            else None
+            for height, width, cover in zip(heights, widths, covers)
+        ]
+        for field_name in self.field_config:
+            if not (field_name.startswith(f"{member}_trans_") and field_name.endswith("_reinf")):
+                continue
+            ratios = []
+            for groups, core in zip(reinforcement_column(field_name), cores):
+                if groups is None or core is None:
+                    ratios.append(None)
+                    continue
+                core_height, core_width = core
+                hoops = [(diameter, spacing) for count, diameter, spacing in groups if count > 0 and spacing]
+                # No spaced hoops is a missing ratio, not a zero one
+                ratios.append(sum(
+                    math.pi * diameter ** 2 / 4 * 2 * (core_height + core_width) / (core_height * core_width * spacing)
+                    for diameter, spacing in hoops
+                ) if hoops else None)
+            metrics[f"{field_name[:-len('_reinf')]}_ratio"] = ratios
+        
+        return metrics
+    
+    def get_field(self, entry_id: int, field_name: str) -> Any:
+        """Value of a stored field (in field_units) or of a derived metric for one entry"""
+        if field_name in self._derived_units() and field_name not in self.field_config:
+            if entry_id not in self._data:
+                raise KeyError(entry_id)
+            return self.get_derived_column(field_name)[entry_id]
+        return self.data[entry_id][field_name]
+    
+    def select(self, field_name: str, min_value: Optional[float] = None, max_value: Optional[float] = None) -> List[int]:
+        """
+        Entries whose numeric field lies within [min_value, max_value]
+        
+        Works on stored fields (in field_units) and on derived metrics. A sorted
+        index is built per field on first use and reused until an entry changes.
+        
+        Args:
+            field_name: Stored or derived field, e.g. 'fc' or 'col_long_ratio'
+            min_value, max_value: Inclusive bounds, None leaves that side open
+        
+        Returns:
+            List of entry ids ordered by the field value, entries without a
+            numeric value are left out
+        """
+        derived_units = self._derived_units()
+        derived = field_name in derived_units and field_name not in self.field_config
+        key = (field_name, derived_units[field_name] if derived else self.field_units.get(field_name))
+        
+        index = self._field_indexes.get(key)
+        if index is None:
+            if derived:
+                pairs = self.get_derived_column(field_name).items()
+            elif field_name in self.field_config:
+                pairs = ((entry_id, entry_data.get(field_name)) for entry_id, entry_data in self.data.items())
+            else:
+                raise KeyError(f"Unknown field '{field_name}'")
+            
+            ordered = sorted((value, entry_id) for entry_id, value in pairs
+                             if isinstance(value, (int, float)) and not isinstance(value, bool))
+            index = self._field_indexes[key] = ([value for value, _ in ordered], [entry_id for _, entry_id in ordered])
+        
+        values, entry_ids = index
+        start = 0 if min_value is None else bisect.bisect_left(values, min_value)
+        end = len(values) if max_value is None else bisect.bisect_right(values, max_value)
+        return entry_ids[start:end]
+    
+    def check_consistency(self, rules: Optional[Dict[str, tuple]] = None,
+                          entry_ids: Optional[List[int]] = None) -> List[FrescoConsistencyIssue]:
+        """
+        Check cross-field rules over the whole database before generating models
+        
+        Each field is read once as a column in the field_config units, then
+        every rule runs over its columns, so one pass reports every offending
+        entry instead of a CAD run failing on the first one.
+        
+        Args:
+            rules: name -> (fields, predicate, message[, severity]), defaults to CONSISTENCY_RULES
+            entry_ids: Entries to check, None checks all
+        
+        Returns:
+            List of FrescoConsistencyIssue, ordered by rule then entry id
+        """
+        rules = CONSISTENCY_RULES if rules is None else rules
+        data = self.view({field_name: config['unit'] for field_name, config in self.field_config.items()}).data
+        entry_ids = sorted(data) if entry_ids is None else [entry_id for entry_id in entry_ids if entry_id in data]
+        entries = [data[entry_id] for entry_id in entry_ids]
+        
+        columns: Dict[str, List[Any]] = {}
+        issues = []
+        for rule, (fields, predicate, message, *severity) in rules.items():
+            severity = severity[0] if severity else 'error'
+            for field_name in fields:
+                if field_name not in columns:
+                    columns[field_name] = [entry_data.get(field_name) for entry_data in entries]
+            
+            for entry_id, values in zip(entry_ids, zip(*(columns[field_name] for field_name in fields))):
+                try:
+                    consistent = predicate(*values)
+                except (TypeError, ValueError):
+                    # Missing or non-numeric values, ReinforcementSyntaxError is a ValueError
+                    consistent = False
+                if not consistent:
+                    issues.append(FrescoConsistencyIssue(entry_id, rule, tuple(fields), message, severity))
+        
+        if issues:
+            warnings = sum(1 for issue in issues if issue.severity == 'warning')
+            logger.warning(f"Consistency check: {len(issues) - warnings} errors and {warnings} warnings in "
+                           f"{len({issue.entry_id for issue in issues})} of {len(entry_ids)} entries")
+        else:
+            logger.info(f"Consistency check: {len(entry_ids)} entries, no issues")
+        return issues
+    
+    def get_preset_units(self, preset: str) -> Dict[str, Optional[str]]:
+        """
+        Field units of a named unit system (see UNIT_SYSTEM_PRESETS)
+        
+        Derived from each field's unit_type, fields whose unit type is not part
+        of the preset keep their current unit.
+        """
+        if preset not in UNIT_SYSTEM_PRESETS:
+            raise KeyError(f"Unknown unit system '{preset}'. Available: {list(UNIT_SYSTEM_PRESETS.keys())}")
+        preset_units = UNIT_SYSTEM_PRESETS[preset]
+        return {
+            field_name: preset_units.get(self.field_unit_types.get(field_name), unit) if unit is not None else None
+            for field_name, unit in self.field_units.items()
+        }
+    
+    def _resolve_target_units(self, target_units) -> Dict[str, Optional[str]]:
+        """Full field -> unit mapping for a preset name or a partial target_units dict"""
+        if isinstance(target_units, str):
+            return self.get_preset_units(target_units)
+        return {**self.field_units, **target_units}
+    
+    def preset_view(self, preset: str) -> Mapping:
+        """
+        Entries converted to a named unit system
+        
+        Shorthand for view(preset).data, entries are converted on access.
+        """
+        return self.view(preset).data
     
+    def apply_unit_preset(self, preset: str) -> FrescoResult:
+        """
+        Switch the whole database to a named unit system (see UNIT_SYSTEM_PRESETS)
+        
+        Converts every column in a single pass and reports one summary line.
+        Entries already converted by a view of the preset are adopted as is.
+        
+        Returns:
+            FrescoResult with the number of converted values
+        """
+        new_field_units = self.get_preset_units(preset)
+        result = FrescoResult("apply_unit_preset")
+        
+        if self._canonical_units is not None:
+            self.field_units = new_field_units
+            logger.info(f"Unit system '{preset}' applied (lossless view)")
+        else:
+            view_data = self.view(new_field_units).data
+            result.conversions, result.reinforcement_conversions = view_data.prefetch()
+            self._data = {entry_id: dict(view_data[entry_id]) for entry_id in self._data}
+            self._data_changed()
+            self.field_units = new_field_units
+            logger.info(f"Unit system '{preset}' applied: {result.conversions} values and {result.reinforcement_conversions} reinforcement strings converted")
+        
+        self.last_modified = datetime.now().isoformat()
+        if self.auto_save:
+            self.save()
+        return result
+
     def _create_backup(self, file_path: str) -> str:
         """Create timestamped backup - updated to handle both .json and .json.gz files"""
         if not os.path.exists(file_path):
@@ -242,7 +2177,7 @@ class FrescoDatabase:
                     db_data = json.load(f)
                 loaded_from = json_file_gz
             except Exception as e:
-                print(f"Error loading compressed database: {e}")
+                logger.error(f"Error loading compressed database: {e}")
         
         # Try uncompressed if compressed failed or doesn't exist
         if db_data is None and os.path.exists(json_file):
@@ -251,7 +2186,7 @@ class FrescoDatabase:
                     db_data = json.load(f)
                 loaded_from = json_file
             except Exception as e:
-                print(f"Error loading database: {e}")
+                logger.error(f"Error loading database: {e}")
                 return
         
         # Try compressed as fallback even if compression is disabled
@@ -261,79 +2196,48 @@ class FrescoDatabase:
                     db_data = json.load(f)
                 loaded_from = json_file_gz
             except Exception as e:
-                print(f"Error loading compressed database: {e}")
+                logger.error(f"Error loading compressed database: {e}")
         
         if db_data:
             if "config" in db_data:
                 config = db_data["config"]
                 self.field_units = config.get("field_units", self.field_units)
+                if config.get("lossless_units"):
+                    # Stored data is canonical, field_units on disk describe it
+                    self.lossless_units = True
+                    self._canonical_units = self.field_units
+                    self.field_units = dict(config.get("view_units", self.field_units))
                 self.version = config.get("version", self.version)
                 self.created_date = config.get("created_date", self.created_date)
                 self.last_modified = config.get("last_modified", self.last_modified)
+                self._source_hashes = {int(k): v for k, v in config.get("source_hashes", {}).items()}
             
             if "data" in db_data:
-                self.data = {int(k): v for k, v in db_data["data"].items()}
+                self._data = {int(k): v for k, v in db_data["data"].items()}
             
-            print(f"Loaded existing database from {loaded_from}")
+            logger.info(f"Loaded existing database from {loaded_from}")
 
-    def set_field_units(self, new_field_units: Dict[str, str]):
+    def set_field_units(self, new_field_units: Dict[str, str]) -> FrescoResult:
         """Set new field units and convert ALL existing data including reinforcement strings"""
-        print(f"Updating field units configuration...")
-        
-        conversions_made = 0
-        reinforcement_conversions = 0
+        logger.info("Updating field units configuration...")
+        result = FrescoResult("set_field_units")
+        
+        if self._canonical_units is not None:
+            # Lossless mode - only the view units change, stored values are untouched
+            for field_name, new_unit in new_field_units.items():
+                if field_name in self.field_units:
+                    self.field_units[field_name] = new_unit
+            self.last_modified = datetime.now().isoformat()
+            logger.info("  Unit view switched, stored values kept in canonical units")
+            
+            if self.auto_save:
+                self.save()
+            return result
         
-        for entry_id, entry_data in self.data.items():
-            for field_name, value in entry_data.items():
-                
-                # Handle regular numeric fields with unit conversion
-                if (field_name in new_field_units and 
-                    field_name in self.field_units and 
-                    self.field_units[field_name] != new_field_units[field_name] and
-                    isinstance(value, (int, float)) and
-                    self.field_units[field_name] is not None and
-                    new_field_units[field_name] is not None):
-                    
-                    old_unit = self.field_units[field_name]
-                    new_unit = new_field_units[field_name]
-                    unit_type = self.field_unit_types.get(field_name)
-                    
-                    if unit_type:
-                        try:
-                            converted_value = self.converter.convert(
-                                value, unit_type, old_unit, new_unit
-                            )
-                            entry_data[field_name] = converted_value
-                            conversions_made += 1
-                            
-                            if self.show_conversion:
-                                print(f"  {field_name}: {value} {old_unit} -> {converted_value:.3f} {new_unit}")
-                        except Exception as e:
-                            print(f"  Warning: Could not convert {field_name}: {e}")
-                
-                # Handle reinforcement string fields (NOW USING HARDCODED LIST)
-                elif (field_name in new_field_units and 
-                      field_name in self.field_units and 
-                      self.field_units[field_name] != new_field_units[field_name] and
-                      isinstance(value, str) and 
-                      self.reinforcement_parser.is_reinforcement_field(field_name)):
-                    
-                    old_unit = self.field_units[field_name]
-                    new_unit = new_field_units[field_name]
-                    
-                    try:
-                        converted_reinforcement = self.reinforcement_parser.parse_and_convert_reinforcement(
-                            value, old_unit, new_unit
-                        )
-                        
-                        if converted_reinforcement != value:
-                            entry_data[field_name] = converted_reinforcement
-                            reinforcement_conversions += 1
-                            
-                            if self.show_conversion:
-                                print(f"  {field_name}: '{value}' -> '{converted_reinforcement}'")
-                    except Exception as e:
-                        print(f"  Warning: Could not convert reinforcement {field_name}: {e}")
+        # Numeric fields are converted one column at a time, reinforcement strings per value
+        plan = self._get_conversion_plan(self.field_units, new_field_units)
+        result.conversions, result.reinforcement_conversions = plan.apply_to_entries(self._data, self.show_conversion)
+        self._data_changed()
         
         # Update field units configuration
         for field_name, new_unit in new_field_units.items():
@@ -343,111 +2247,77 @@ class FrescoDatabase:
         self.last_modified = datetime.now().isoformat()
                 
         self.save()
+        return result
     
-    def _parse_and_convert_input_data(self, input_data: Dict[str, Any], show_error_fileds:bool = False) -> Dict[str, Any]:
+    def _get_conversion_plan(self, source_units: Dict[str, Optional[str]], target_units: Dict[str, Optional[str]]) -> FrescoConversionPlan:
+        """
+        Get the cached conversion plan from source_units to target_units
+        
+        Fields missing from source_units are assumed to already be in the target unit.
+        """
+        key = (tuple(source_units.items()), tuple(target_units.items()))
+        plan = self._conversion_plans.get(key)
+        if plan is None:
+            if len(self._conversion_plans) >= 256:
+                self._conversion_plans.clear()
+            plan = FrescoConversionPlan(self.converter, self.reinforcement_parser, self.field_unit_types,
+                                        source_units, target_units)
+            self._conversion_plans[key] = plan
+        return plan
+
+    def _parse_and_convert_input_data(self, input_data: Dict[str, Any], show_error_fileds:bool = False,
+                                      result: Optional[FrescoResult] = None) -> Dict[str, Any]:
         """
         Helper method to parse enhanced input format and convert units
         
         Handles both [value, unit] format and standard value format
-        Returns converted data with progress reporting
+        Returns converted data, removed fields and conversions are added to result if given
         """
-        # Parse enhanced input format [value, unit] and extract data + units
+        # Parse enhanced input format [value, unit] and validate in a single pass
         converted_data = {}
         input_units = {}
+        removed_fields = []
+        checks = self.validator.checks
+        generic_check = self.validator.generic_check
         
         for field_name, field_input in input_data.items():
             if isinstance(field_input, (list, tuple)) and len(field_input) == 2:
                 # Enhanced format: [value, unit]
                 value, unit = field_input
-                converted_data[field_name] = value
-                input_units[field_name] = unit
+                has_unit = True
             else:
                 # Standard format: just value (use database default unit)
-                converted_data[field_name] = field_input
-        
-        # Validation Rules - Remove invalid fields
-        removed_fields = []
-        for field_name, value in list(converted_data.items()):
+                value, unit = field_input, None
+                has_unit = False
             
-            # Rule 1: Value Type Validation - remove type objects
-            if isinstance(value, type):
-                converted_data.pop(field_name, None)
-                input_units.pop(field_name, None)
-                if self.show_invalid_object:
-                    removed_fields.append(f"{field_name} (type object '{value.__name__}')")
+            rejected = checks.get(field_name, generic_check)(field_name, value, unit)
+            if rejected:
+                kind, reason = rejected
+                if result is not None:
+                    result.removed_fields.append(reason)
+                if (kind == 'object' and self.show_invalid_object) or (kind == 'unit' and self.show_invalid_unit):
+                    removed_fields.append(reason)
                 continue
             
-            # Rule 2: Unit Type Validation - remove wrong unit types
-            if field_name in input_units and field_name in self.field_unit_types:
-                provided_unit = input_units[field_name]
-                expected_unit_type = self.field_unit_types[field_name]
-                
-                if expected_unit_type and provided_unit:
-                    available_units = self.converter.get_available_units(expected_unit_type)
-                    if provided_unit not in available_units:
-                        converted_data.pop(field_name, None)
-                        input_units.pop(field_name, None)
-                        if self.show_invalid_unit:
-                            removed_fields.append(f"{field_name} (invalid unit '{provided_unit}' for {expected_unit_type})")
+            converted_data[field_name] = value
+            if has_unit:
+                input_units[field_name] = unit
         
         if removed_fields:
-            print(f"  Removed {len(removed_fields)} invalid fields")
+            logger.warning(f"  Removed {len(removed_fields)} invalid fields")
             if show_error_fileds:
                 for item in removed_fields:
-                    print(item)
-        
-        # End Validation Rules
-
-
-        conversions_made = 0
-        reinforcement_conversions = 0
-        
-        # Convert input data to database default units
-        for field_name, value in converted_data.items():
-            
-            # Handle regular numeric fields
-            if (isinstance(value, (int, float)) and 
-                field_name in self.field_units and 
-                self.field_units[field_name] is not None):
-                
-                input_unit = input_units.get(field_name, self.field_units[field_name])
-                db_unit = self.field_units[field_name]
-                unit_type = self.field_unit_types.get(field_name)
-                
-                if input_unit != db_unit and unit_type:
-                    try:
-                        converted_value = self.converter.convert(
-                            value, unit_type, input_unit, db_unit
-                        )
-                        converted_data[field_name] = converted_value
-                        conversions_made += 1
-                        
-                        if self.show_conversion:
-                            print(f"  {field_name}: {value} {input_unit} -> {converted_value:.3f} {db_unit}")
-                    except Exception as e:
-                        print(f"  Warning: Could not convert {field_name}: {e}")
-            
-            # Handle reinforcement string conversion
-            elif (isinstance(value, str) and 
-                self.reinforcement_parser.is_reinforcement_field(field_name)):
-                
-                input_unit = input_units.get(field_name, self.field_units[field_name])
-                db_unit = self.field_units[field_name]
-                
-                if input_unit != db_unit:
-                    try:
-                        converted_reinforcement = self.reinforcement_parser.parse_and_convert_reinforcement(
-                            value, input_unit, db_unit
-                        )
-                        
-                        if converted_reinforcement != value:
-                            converted_data[field_name] = converted_reinforcement
-                            reinforcement_conversions += 1
-                            
-                            if self.show_conversion:
-                                print(f"  {field_name}: '{value}' -> '{converted_reinforcement}'")
-                    except Exception as e:
-                        print(f"  Warning: Could not convert reinforcement {field_name}: {e}")
+                    logger.warning(item)
+        
+        # Convert input data to database default units (canonical units in lossless mode,
+        # where plain values are still read in the current field_units)
+        storage_units = self._storage_units
+        source_units = input_units if storage_units is self.field_units else {**self.field_units, **input_units}
+        plan = self._get_conversion_plan(source_units, storage_units)
+        conversions_made, reinforcement_conversions = plan.apply_to_entry(converted_data, self.show_conversion)
+        if result is not None:
+            result.conversions += conversions_made
+            result.reinforcement_conversions += reinforcement_conversions
         
         return converted_data
 
@@ -467,94 +2337,293 @@ class FrescoDatabase:
                 ordered_data[field_name] = entry_data[field_name]
         return ordered_data
 
-    def add_entry(self, entry_id: int, entry_data: Dict[str, Any], overwrite: bool = False, show_error_fields: bool = False):
+    def _normalise_entry(self, entry_data: Dict[str, Any], show_error_fields: bool = False,
+                         result: Optional[FrescoResult] = None) -> Dict[str, Any]:
+        """
+        Convert raw entry data into a complete entry in database units
+        
+        Parses [value, unit] input, fills missing fields with defaults from
+        empty_field_config and orders the fields following RCF_FIELD_CONFIG.
+        """
+        # Use existing conversion logic
+        converted_data = self._parse_and_convert_input_data(entry_data, show_error_fields, result)
+
+        # Fill missing fields with the pre-converted defaults and order following RCF_FIELD_CONFIG in one pass
+        defaults = self._converted_defaults()
+        ordered_data = {}
+        missing_fields = 0
+        for field_name in self.field_config:
+            if field_name in converted_data:
+                ordered_data[field_name] = converted_data[field_name]
+            elif field_name in defaults:
+                ordered_data[field_name] = defaults[field_name]
+                missing_fields += 1
+        # Defaults of fields outside field_config are counted but not stored
+        missing_fields += sum(1 for field_name in defaults
+                              if field_name not in self.field_config and field_name not in converted_data)
+        
+        if missing_fields:
+            logger.info(f"  Filled {missing_fields} missing fields with defaults")
+        if result is not None:
+            result.filled_fields = missing_fields
+        
+        return ordered_data
+    
+    def _converted_defaults(self) -> Dict[str, Any]:
+        """
+        empty_field_config converted to the stored units, cached per unit system
+        
+        Defaults are plain values in field_units, so they only need converting
+        in lossless mode while a different view is active.
+        """
+        storage_units = self._storage_units
+        source_units = {} if storage_units is self.field_units else self.field_units
+        key = (tuple(source_units.items()), tuple(storage_units.items()))
+        
+        defaults = self._default_entries.get(key)
+        if defaults is None:
+            if len(self._default_entries) >= 16:
+                self._default_entries.clear()
+            defaults = {field_name: value for field_name, value in self.empty_field_config.items()
+                        if not isinstance(value, type)}
+            self._get_conversion_plan(source_units, storage_units).apply_to_entry(defaults)
+            self._default_entries[key] = defaults
+        return defaults
+
+    def add_entry(self, entry_id: int, entry_data: Dict[str, Any], overwrite: bool = False,
+                  show_error_fields: bool = False) -> FrescoResult:
+        """
+        Add new entry with automatic unit conversion including reinforcement parsing
+        
+        Args:
+            entry_id: Unique identifier for the entry
+            entry_data: Data to add (supports [value, unit] format)
+            overwrite: If True, allows overwriting existing entries
+            show_error_fields: If True, shows detailed validation errors
+        
+        Returns:
+            FrescoResult, falsy if the entry already exists and overwrite is False
+        
+        Raises:
+            ReinforcementSyntaxError: If a reinforcement field is malformed, nothing is stored
+        """
+        # Check if entry already exists
+        if entry_id in self._data and not overwrite:
+            self._log_entry_exists(entry_id)
+            return FrescoResult("add_entry", entry_id, success=False)
+        
+        action = "Overwriting" if entry_id in self._data else "Adding"
+        action_result = "overwritten" if entry_id in self._data else "added"
+        logger.info(f"{action} entry {entry_id}...")
+        
+        result = FrescoResult("overwrite_entry" if entry_id in self._data else "add_entry", entry_id)
+        converted_data = self._normalise_entry(entry_data, show_error_fields, result)
+        
+        # Store the converted data (complete replacement)
+        self._data[entry_id] = converted_data
+        self._entry_changed(entry_id)
+        self.last_modified = datetime.now().isoformat()
+        logger.info(f"Entry {entry_id} {action_result} successfully")
+        
+        if self.auto_save:
+            self.save()
+        return result
+    
+    @staticmethod
+    def _log_entry_exists(entry_id: int):
+        """Report an add over an existing entry without overwrite"""
+        logger.error(f"Entry {entry_id} already exists!")
+        logger.error("Use overwrite=True to replace, or use update_entry() to modify specific fields")
+
+    def add_entries(self, entries: Dict[int, Dict[str, Any]], overwrite: bool = False, show_error_fields: bool = False,
+                    workers: Optional[int] = None, chunk_size: Optional[int] = None) -> List[FrescoResult]:
+        """
+        Add many entries at once with a single save at the end
+        
+        Validation and unit conversion can run on a process pool, entries are
+        then stored in the order they were given and their messages logged in
+        that order, so the result does not depend on the number of workers.
+        
+        Args:
+            entries: entry_id -> entry data (supports [value, unit] format)
+            overwrite: If True, allows overwriting existing entries
+            show_error_fields: If True, shows detailed validation errors
+            workers: Worker processes, None or 1 normalises in this process
+            chunk_size: Entries per task sent to a worker (default: about 4 tasks per worker)
+        
+        Returns:
+            One FrescoResult per entry added or overwritten, in input order
+        
+        Raises:
+            ReinforcementSyntaxError: If a reinforcement field is malformed, no entry is stored
+        """
+        pending = []
+        for entry_id, entry_data in entries.items():
+            if entry_id in self._data and not overwrite:
+                self._log_entry_exists(entry_id)
+                continue
+            pending.append((entry_id, entry_data))
+        
+        if workers and workers > 1 and len(pending) > 1:
+            chunk_size = chunk_size or max(1, -(-len(pending) // (workers * 4)))
+            chunks = [pending[start:start + chunk_size] for start in range(0, len(pending), chunk_size)]
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_entry_worker,
+                                     initargs=(self._worker_settings(),)) as executor:
+                # map() keeps the input order, whichever worker finishes first
+                results = [result for chunk_results in executor.map(_normalise_entry_chunk, chunks,
+                                                                   [show_error_fields] * len(chunks))
+                           for result in chunk_results]
+        else:
+            results = [_normalise_entry_logged(self, entry_id, entry_data, show_error_fields)
+                       for entry_id, entry_data in pending]
+        
+        entry_results = []
+        for entry_id, records, normalised, result in results:
+            action = "Overwriting" if entry_id in self._data else "Adding"
+            action_result = "overwritten" if entry_id in self._data else "added"
+            if entry_id in self._data:
+                result.operation = "overwrite_entry"
+            logger.info(f"{action} entry {entry_id}...")
+            for record in records:
+                logger.handle(record)
+            
+            self._data[entry_id] = normalised
+            self._entry_changed(entry_id)
+            logger.info(f"Entry {entry_id} {action_result} successfully")
+            entry_results.append(result)
+        
+        if results:
+            self.last_modified = datetime.now().isoformat()
+            if self.auto_save:
+                self.save()
+        return entry_results
+    
+    @staticmethod
+    def _source_hash(entry_data: Dict[str, Any]) -> str:
+        """Content hash of a raw entry as written in a catalogue, type placeholders are hashed by name"""
+        canonical = json.dumps(entry_data, sort_keys=True,
+                               default=lambda value: f"<{value.__name__}>" if isinstance(value, type) else repr(value))
+        return hashlib.sha1(canonical.encode('utf-8')).hexdigest()
+    
+    def sync_entries(self, entries: Dict[int, Dict[str, Any]], show_error_fields: bool = False,
+                     workers: Optional[int] = None, parallel_threshold: int = 300) -> Dict[str, List[int]]:
         """
-        Add new entry with automatic unit conversion including reinforcement parsing
+        Bring the database in line with a catalogue of raw entries, touching only what changed
+        
+        Each raw entry is hashed and compared with the hash stored when it was
+        last synced. Only added or edited entries are validated and converted
+        again, entries that were synced before and are no longer in the
+        catalogue are removed. Entries added by hand are left alone. The
+        database is saved once, and only if something changed.
         
         Args:
-            entry_id: Unique identifier for the entry
-            entry_data: Data to add (supports [value, unit] format)
-            overwrite: If True, allows overwriting existing entries
+            entries: entry_id -> raw entry data, the complete catalogue
             show_error_fields: If True, shows detailed validation errors
-        """
-        # Check if entry already exists
-        if entry_id in self.data and not overwrite:
-            print(f"Error: Entry {entry_id} already exists!")
-            print(f"Use overwrite=True to replace, or use update_entry() to modify specific fields")
-            return False
-        
-        action = "Overwriting" if entry_id in self.data else "Adding"
-        action_result = "overwritten" if entry_id in self.data else "added"
-        print(f"{action} entry {entry_id}...")
-        
-        # Use existing conversion logic
-        converted_data = self._parse_and_convert_input_data(entry_data, show_error_fields)
-
-        # Fill missing fields with defaults from empty_field_config
-        missing_fields = {}
-        for field_name, default_value in self.empty_field_config.items():
-            if field_name not in converted_data:
-                missing_fields[field_name] = default_value
-        
-        if missing_fields:
-            # Use the same conversion logic for missing fields
-            converted_missing = self._parse_and_convert_input_data(missing_fields)
-            converted_data.update(converted_missing)
-            print(f"  Filled {len(missing_fields)} missing fields with defaults")
-
-        # Create ordered dictionary following RCF_FIELD_CONFIG order
-        converted_data = self._reorder_entry_data(converted_data)
+            workers: Worker processes for the changed entries (see add_entries)
+            parallel_threshold: Fewer changed entries are normalised in this process, starting
+                the worker processes costs more than a small incremental sync
         
-        # Store the converted data (complete replacement)
-        self.data[entry_id] = converted_data
-        self.last_modified = datetime.now().isoformat()
-        print(f"Entry {entry_id} {action_result} successfully")
+        Returns:
+            Dict with the "added", "changed" and "removed" entry ids and the
+            number of "unchanged" entries
+        """
+        source_hashes = {entry_id: self._source_hash(entry_data) for entry_id, entry_data in entries.items()}
+        pending = [entry_id for entry_id, source_hash in source_hashes.items()
+                   if entry_id not in self._data or self._source_hashes.get(entry_id) != source_hash]
+        removed = [entry_id for entry_id in self._source_hashes if entry_id not in source_hashes]
+        summary = {
+            "added": [entry_id for entry_id in pending if entry_id not in self._data],
+            "changed": [entry_id for entry_id in pending if entry_id in self._data],
+            "removed": removed,
+            "unchanged": len(source_hashes) - len(pending),
+        }
         
-        if self.auto_save:
-            self.save()
-        return True
-
-    def update_entry(self, entry_id: int, updates: Dict[str, Any], show_error_fields: bool = False):
+        auto_save = self.auto_save
+        self.auto_save = False
+        try:
+            self.add_entries({entry_id: entries[entry_id] for entry_id in pending}, overwrite=True,
+                             show_error_fields=show_error_fields,
+                             workers=workers if len(pending) >= parallel_threshold else None)
+        finally:
+            self.auto_save = auto_save
+        
+        for entry_id in removed:
+            if self._data.pop(entry_id, None) is not None:
+                logger.info(f"Entry {entry_id} removed successfully")
+            self._entry_changed(entry_id)
+        for entry_id in pending:
+            self._source_hashes[entry_id] = source_hashes[entry_id]
+        
+        logger.info(f"Sync: {len(summary['added'])} added, {len(summary['changed'])} changed, "
+                    f"{len(removed)} removed, {summary['unchanged']} unchanged")
+        
+        if pending or removed:
+            self.last_modified = datetime.now().isoformat()
+            if self.auto_save:
+                self.save()
+        return summary
+    
+    def _worker_settings(self) -> Dict[str, Any]:
+        """Picklable state a worker process needs to normalise entries like this database"""
+        return {
+            "field_config": self.field_config,
+            "empty_field_config": self.empty_field_config,
+            "field_units": self.field_units,
+            "canonical_units": self._canonical_units,
+            "unit_overrides": self.converter._overrides,
+            "show_conversion": self.show_conversion,
+            "show_invalid_object": self.show_invalid_object,
+            "show_invalid_unit": self.show_invalid_unit,
+            "log_level": logger.getEffectiveLevel(),
+        }
+    
+    def update_entry(self, entry_id: int, updates: Dict[str, Any], show_error_fields: bool = False) -> FrescoResult:
         """
         Update existing entry
+        
+        Returns:
+            FrescoResult, falsy if the entry does not exist
         """
-        if entry_id not in self.data:
-            print(f"Entry {entry_id} not found in database")
-            return False
+        if entry_id not in self._data:
+            logger.warning(f"Entry {entry_id} not found in database")
+            return FrescoResult("update_entry", entry_id, success=False)
         
-        print(f"Updating entry {entry_id}...")
+        logger.info(f"Updating entry {entry_id}...")
+        result = FrescoResult("update_entry", entry_id)
         
         # Use existing conversion logic
-        converted_updates = self._parse_and_convert_input_data(updates, show_error_fields)
+        converted_updates = self._parse_and_convert_input_data(updates, show_error_fields, result)
         
         # Update existing entry fields
         for field_name, field_value in converted_updates.items():
-            self.data[entry_id][field_name] = field_value
+            self._data[entry_id][field_name] = field_value
         
         # Create ordered dictionary following RCF_FIELD_CONFIG order
-        self.data[entry_id] = self._reorder_entry_data(self.data[entry_id])
+        self._data[entry_id] = self._reorder_entry_data(self._data[entry_id])
+        self._entry_changed(entry_id)
         
         self.last_modified = datetime.now().isoformat()
-        print(f"Entry {entry_id} updated successfully")
+        logger.info(f"Entry {entry_id} updated successfully")
         
         if self.auto_save:
             self.save()
-        return True
+        return result
     
-    def remove_entry(self, entry_id: int):
-        """Remove entry with given ID"""
-        if entry_id not in self.data:
-            print(f"Entry {entry_id} not found in database")
-            return False
-        
-        self.data.pop(entry_id)
+    def remove_entry(self, entry_id: int) -> FrescoResult:
+        """Remove entry with given ID, the result is falsy if it does not exist"""
+        if entry_id not in self._data:
+            logger.warning(f"Entry {entry_id} not found in database")
+            return FrescoResult("remove_entry", entry_id, success=False)
+        
+        self._data.pop(entry_id)
+        self._entry_changed(entry_id)
         self.last_modified = datetime.now().isoformat()
         
-        print(f"Entry {entry_id} removed successfully")
+        logger.info(f"Entry {entry_id} removed successfully")
         
         if self.auto_save:
             self.save()
-        return True
+        return FrescoResult("remove_entry", entry_id)
     
     def save(self):
         """Save database to JSON"""
@@ -564,18 +2633,27 @@ class FrescoDatabase:
         else:
             json_file = f"{self.db_name}.json"
         
-        # Prepare database export
+        self._write_json(json_file, self._storage_units, self._data, self._save_extra_config())
+              
+        compression_info = " (compressed)" if self.compress_db else ""
+        logger.info(f"Database saved: {json_file}{compression_info} ({len(self.data)} entries)")
+    
+    def _save_extra_config(self) -> Dict[str, Any]:
+        """Config entries of the database file beyond the common ones"""
+        extra_config = {}
+        if self._canonical_units is not None:
+            extra_config = {"lossless_units": True, "view_units": self.field_units}
+        if self._source_hashes:
+            extra_config["source_hashes"] = self._source_hashes
+        return extra_config
+    
+    def _write_json(self, json_file: str, field_units: Dict[str, Optional[str]], entries: Dict[int, Dict[str, Any]],
+                    extra_config: Optional[Dict[str, Any]] = None):
+        """Write entries and their config in the database file format"""
         db_export = {
-            "config": {
-                "field_units": self.field_units,
-                "field_config": self.field_config,
-                "version": self.version,
-                "created_date": self.created_date,
-                "last_modified": self.last_modified,
-                "compressed": self.compress_db
-            },
-            "data": self.data,
-            "total_entries": len(self.data)
+            "config": self._json_config(field_units, self.compress_db, extra_config),
+            "data": entries,
+            "total_entries": len(entries)
         }
         
         # Save JSON (compressed or uncompressed)
@@ -585,86 +2663,407 @@ class FrescoDatabase:
         else:
             with open(json_file, 'w') as f:
                 json.dump(db_export, f, indent=2)
-              
-        compression_info = " (compressed)" if self.compress_db else ""
-        print(f"Database saved: {json_file}{compression_info} ({len(self.data)} entries)")
     
-    def export_json(self, filename: Optional[str] = None, target_units: Optional[Dict[str, str]] = None):
-        """Export database, optionally with different units"""
+    def _json_config(self, field_units: Dict[str, Optional[str]], compressed: bool,
+                     extra_config: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """The "config" section of the database file format"""
+        return {
+            "field_units": field_units,
+            "field_config": self.field_config,
+            "version": self.version,
+            "created_date": self.created_date,
+            "last_modified": self.last_modified,
+            "compressed": compressed,
+            **(extra_config or {})
+        }
+    
+    def export_all(self, formats: Sequence[str] = ('json', 'csv'), units: Optional[Union[Dict[str, str], str]] = None,
+                   filename: Optional[str] = None, compress: Optional[bool] = None,
+                   chunk_size: int = 256) -> Dict[str, str]:
+        """
+        Export the database to several formats in a single pass
+        
+        Entries are read and converted once, a chunk at a time, and every chunk
+        is handed to one writer thread per format, so conversion, writing and
+        compression overlap.
+        
+        Args:
+            formats: Names from EXPORT_FORMATS ('json', 'csv', 'jsonl', 'columns', 'parquet',
+                'npz') or 'columnar' for Parquet when pyarrow is installed and npz otherwise
+            units: field_name -> unit dict or a UNIT_SYSTEM_PRESETS name, None keeps field_units
+            filename: Base name of the files (without extension)
+            compress: gzip the JSON based formats, default compress_db
+            chunk_size: Entries converted and handed to the writers together
+        
+        Returns:
+            Dict of format -> written file name
+        
+        Raises:
+            ValueError: For an unknown format
+            ImportError: For parquet without pyarrow, npz without numpy
+        """
+        unknown = [format_name for format_name in formats if format_name not in EXPORT_FORMATS and format_name != 'columnar']
+        if unknown:
+            raise ValueError(f"Unknown export formats {unknown}, available: {list(EXPORT_FORMATS) + ['columnar']}")
+        
+        resolved = {format_name: ('parquet' if pa is not None else 'npz') if format_name == 'columnar' else format_name
+                    for format_name in formats}
+        if 'parquet' in resolved.values() and pa is None:
+            raise ImportError("Parquet export requires pyarrow (pip install pyarrow)")
+        if 'npz' in resolved.values() and np is None:
+            raise ImportError("Columnar export requires pyarrow or numpy (pip install pyarrow)")
+        
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        export_name = filename or f"{self.db_name}_export_{timestamp}"
+        compress = self.compress_db if compress is None else compress
+        
+        result = FrescoResult("export_all")
+        export_units, entries = self._stream_entries(units, result, chunk_size)
+        export_units = dict(export_units)
+        fields = self._export_fields()
+        
+        writers = []
+        for format_name, writer_format in resolved.items():
+            path = export_name + EXPORT_FORMATS[writer_format]
+            if writer_format in ('parquet', 'npz'):
+                writer_class = _ParquetExportWriter if writer_format == 'parquet' else _NpzExportWriter
+                metadata = {"database": os.path.basename(self.db_name), "version": self.version,
+                            "last_modified": self.last_modified}
+                writer = writer_class(path, fields, export_units, self.field_config, metadata, compress)
+            elif writer_format == 'json':
+                path += ".gz" if compress else ""
+                writer = _JsonExportWriter(path, self._json_config(export_units, compress), len(self._data), compress)
+            elif writer_format == 'csv':
+                writer = _CsvExportWriter(path, fields, export_units)
+            elif writer_format == 'jsonl':
+                path += ".gz" if compress else ""
+                writer = _JsonLinesExportWriter(path, compress)
+            else:
+                path += ".gz" if compress else ""
+                writer = _ColumnsExportWriter(path, fields, export_units, compress)
+            writers.append((format_name, writer))
+        
+        logger.info(f"Exporting {', '.join(formats)}: {export_name}")
+        with ThreadPoolExecutor(max_workers=max(1, len(writers))) as executor:
+            queues = [queue.Queue(maxsize=4) for _ in writers]
+            futures = [executor.submit(_drain_export_queue, writer, chunks)
+                       for (_, writer), chunks in zip(writers, queues)]
+            try:
+                for chunk in _chunked(entries, chunk_size):
+                    for chunks, future in zip(queues, futures):
+                        _put_export_chunk(chunks, future, chunk)
+            finally:
+                for chunks, future in zip(queues, futures):
+                    _put_export_chunk(chunks, future, None)
+            for future in futures:
+                future.result()
+        
+        if result.conversions or result.reinforcement_conversions:
+            logger.info(f"  Converted {result.conversions} numeric values and "
+                        f"{result.reinforcement_conversions} reinforcement strings once for all formats")
+        written = {format_name: writer.path for format_name, writer in writers}
+        for format_name, path in written.items():
+            logger.info(f"  {format_name}: {path}")
+        for format_name, writer in writers:
+            if getattr(writer, 'dropped_values', 0):
+                logger.warning(f"  {writer.dropped_values} values not matching their data_type "
+                               f"written as missing in {format_name}")
+        return written
+    
+    def export_columnar(self, filename: Optional[str] = None,
+                        target_units: Optional[Union[Dict[str, str], str]] = None,
+                        compress: Optional[bool] = None) -> str:
+        """
+        Export to a typed columnar file for analytics (see export_all)
+        
+        Writes Parquet when pyarrow is installed, otherwise a NumPy .npz bundle.
+        Columns are typed from the field_config data_type, units are stored as
+        metadata and the fields in CATEGORICAL_FIELDS are dictionary-encoded.
+        
+        Returns:
+            str: The file name written
+        """
+        return self.export_all(['columnar'], target_units, filename, compress)['columnar']
+    
+    def _entry_hashes(self, target_units: Optional[Union[Dict[str, str], str]] = None):
+        """
+        Content hash of every entry as exported in target_units
+        
+        Returns:
+            Tuple of (units, {entry_id: hash}, generator of (entry_id, entry, hash))
+        """
+        units, entries = self._stream_entries(target_units)
+        hashes = {}
+        
+        def hashed():
+            for entry_id, entry_data in entries:
+                hashes[entry_id] = self._delta_hash(entry_data)
+                yield entry_id, entry_data, hashes[entry_id]
+        return dict(units), hashes, hashed()
+    
+    @staticmethod
+    def _delta_hash(entry_data: Dict[str, Any]) -> str:
+        """Content hash of a converted entry, numbers rounded to 6 significant digits to absorb conversion round-off"""
+        return FrescoDatabase._source_hash({
+            field_name: float(f"{value:.6g}") if isinstance(value, (int, float)) and not isinstance(value, bool) else value
+            for field_name, value in entry_data.items()
+        })
+    
+    def _manifest(self, units: Dict[str, Optional[str]], hashes: Dict[int, str]) -> Dict[str, Any]:
+        return {
+            "format": "fresco-manifest",
+            "version": self.DELTA_FORMAT_VERSION,
+            "database": os.path.basename(self.db_name),
+            "created": datetime.now().isoformat(),
+            "field_units": units,
+            "entries": {str(entry_id): entry_hash for entry_id, entry_hash in hashes.items()},
+        }
+    
+    @classmethod
+    def _read_delta_file(cls, source: Union[str, Dict[str, Any]], file_format: str) -> Dict[str, Any]:
+        """
+        Read a manifest or patch file (.gz files are decompressed) or check an already loaded one
+        
+        Raises:
+            ValueError: If it is not a file_format file of a supported version
+        """
+        if isinstance(source, str):
+            with (gzip.open(source, 'rt', encoding='utf-8') if source.endswith('.gz')
+                  else open(source, 'r', encoding='utf-8')) as f:
+                content = json.load(f)
+        else:
+            content = source
+        
+        if not isinstance(content, dict) or content.get("format") != file_format:
+            raise ValueError(f"Not a {file_format} file")
+        if content.get("version") != cls.DELTA_FORMAT_VERSION:
+            raise ValueError(f"Unsupported {file_format} version {content.get('version')}, "
+                             f"expected {cls.DELTA_FORMAT_VERSION}")
+        return content
+    
+    def export_manifest(self, filename: Optional[str] = None,
+                        target_units: Optional[Union[Dict[str, str], str]] = None) -> str:
+        """
+        Write the content hash of every entry, the baseline for export_patch
+        
+        Args:
+            filename: Optional custom filename (without extension)
+            target_units: Units the entries are hashed in, should match the units mirrors receive
+        
+        Returns:
+            str: The filename of the manifest (<filename>.manifest.json)
+        """
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        manifest_file = f"{filename or f'{self.db_name}_{timestamp}'}.manifest.json"
+        units, hashes, hashed = self._entry_hashes(target_units)
+        for _ in hashed:
+            pass
+        
+        with open(manifest_file, 'w', encoding='utf-8') as f:
+            json.dump(self._manifest(units, hashes), f)
+        logger.info(f"Manifest written: {manifest_file} ({len(hashes)} entries)")
+        return manifest_file
+    
+    def export_patch(self, base_manifest: Union[str, Dict[str, Any]], filename: Optional[str] = None,
+                     target_units: Optional[Union[Dict[str, str], str]] = None,
+                     compress: Optional[bool] = None) -> str:
+        """
+        Export only the entries added, changed or removed since a manifest
+        
+        Writes <filename>.patch.json(.gz) and the manifest of the current state,
+        <filename>.manifest.json, to use as the base of the next patch. Entries are
+        compared in the manifest units unless target_units is given, and written in
+        the units they are stored in, so apply_patch converts them only once.
+        
+        Args:
+            base_manifest: Path of a manifest (export_manifest/export_patch) or its content
+            filename: Optional custom filename (without extension)
+            target_units: Units the entries are compared in, default those of the manifest
+            compress: gzip the patch, default compress_db
+        
+        Returns:
+            str: The filename of the patch, apply it with apply_patch
+        
+        Raises:
+            ValueError: If base_manifest is not a manifest of a supported version
+        """
+        base = self._read_delta_file(base_manifest, "fresco-manifest")
+        base_hashes = {int(entry_id): entry_hash for entry_id, entry_hash in base["entries"].items()}
+        if target_units is None:
+            target_units = base["field_units"]
+        
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        export_name = filename or f"{self.db_name}_patch_{timestamp}"
+        compress = self.compress_db if compress is None else compress
+        
+        units, hashes, hashed = self._entry_hashes(target_units)
+        patch = {
+            "format": "fresco-patch",
+            "version": self.DELTA_FORMAT_VERSION,
+            "database": os.path.basename(self.db_name),
+            "created": datetime.now().isoformat(),
+            "field_units": units,
+            # Units of the added and changed entries
+            "entry_units": dict(self._storage_units),
+            "added": {},
+            "changed": {},
+            "removed": [],
+            # Hashes before (changed and removed) and after (added and changed) the patch
+            "base_hashes": {},
+            "hashes": {},
+        }
+        for entry_id, _, entry_hash in hashed:
+            base_hash = base_hashes.get(entry_id)
+            if base_hash == entry_hash:
+                continue
+            if base_hash is None:
+                patch["added"][str(entry_id)] = self._data[entry_id]
+            else:
+                patch["changed"][str(entry_id)] = self._data[entry_id]
+                patch["base_hashes"][str(entry_id)] = base_hash
+            patch["hashes"][str(entry_id)] = entry_hash
+        for entry_id, base_hash in base_hashes.items():
+            if entry_id not in hashes:
+                patch["removed"].append(entry_id)
+                patch["base_hashes"][str(entry_id)] = base_hash
+        
+        patch_file = f"{export_name}.patch.json{'.gz' if compress else ''}"
+        with _open_export(patch_file, compress) as f:
+            json.dump(patch, f)
+        manifest_file = f"{export_name}.manifest.json"
+        with open(manifest_file, 'w', encoding='utf-8') as f:
+            json.dump(self._manifest(units, hashes), f)
+        
+        logger.info(f"Patch exported: {patch_file} ({len(patch['added'])} added, {len(patch['changed'])} changed, "
+                    f"{len(patch['removed'])} removed, {len(hashes) - len(patch['hashes'])} unchanged)")
+        logger.info(f"Next base manifest: {manifest_file}")
+        return patch_file
+    
+    def apply_patch(self, patch_file: Union[str, Dict[str, Any]], verify: bool = True,
+                    show_error_fields: bool = False, workers: Optional[int] = None) -> Dict[str, List[int]]:
+        """
+        Apply a patch written by export_patch
+        
+        Patched entries are converted from the units the source database stores
+        them in to the database units column-wise, the same single conversion
+        as a full export, and stored through add_entries. Removed entries are
+        dropped. The database is saved once.
+        
+        Args:
+            patch_file: Path of the patch or its content
+            verify: Check that changed and removed entries match the patch base and that
+                added entries are new, nothing is applied otherwise
+            show_error_fields: If True, shows detailed validation errors
+            workers: Worker processes for the patched entries (see add_entries)
+        
+        Returns:
+            Dict with the "added", "changed" and "removed" entry ids
+        
+        Raises:
+            ValueError: If it is not a patch of a supported version, or if verify is True
+                and the database is not at the patch base
+        """
+        patch = self._read_delta_file(patch_file, "fresco-patch")
+        
+        patch_units = patch["field_units"]
+        added = {int(entry_id): dict(entry_data) for entry_id, entry_data in patch["added"].items()}
+        changed = {int(entry_id): dict(entry_data) for entry_id, entry_data in patch["changed"].items()}
+        removed = [int(entry_id) for entry_id in patch["removed"]]
+        
+        if verify:
+            conflicts = [entry_id for entry_id in added if entry_id in self._data]
+            base_view = self.view(patch_units).data
+            for entry_id, base_hash in patch["base_hashes"].items():
+                entry_id = int(entry_id)
+                if entry_id not in self._data or self._delta_hash(base_view[entry_id]) != base_hash:
+                    conflicts.append(entry_id)
+            if conflicts:
+                raise ValueError(f"Database does not match the patch base for entries {sorted(conflicts)}")
+        
+        # Plain values of the patched entries are read in field_units by add_entries
+        entries = {**added, **changed}
+        self._get_conversion_plan(patch["entry_units"], self.field_units).apply_to_entries(entries)
+        self._tag_list_values(entries)
+        
+        auto_save = self.auto_save
+        self.auto_save = False
+        try:
+            self.add_entries(entries, overwrite=True, show_error_fields=show_error_fields, workers=workers)
+        finally:
+            self.auto_save = auto_save
+        
+        summary = {"added": list(added), "changed": list(changed), "removed": []}
+        for entry_id in removed:
+            if self._data.pop(entry_id, None) is not None:
+                self._entry_changed(entry_id)
+                summary["removed"].append(entry_id)
+                logger.info(f"Entry {entry_id} removed successfully")
+        
+        logger.info(f"Patch applied: {len(summary['added'])} added, {len(summary['changed'])} changed, "
+                    f"{len(summary['removed'])} removed")
+        if entries or summary["removed"]:
+            self.last_modified = datetime.now().isoformat()
+            if self.auto_save:
+                self.save()
+        return summary
+    
+    def export_json(self, filename: Optional[str] = None, target_units: Optional[Union[Dict[str, str], str]] = None,
+                    compress: Optional[bool] = None) -> str:
+        """
+        Export database, optionally with different units (field -> unit dict or a UNIT_SYSTEM_PRESETS name)
+        
+        Converted exports are streamed to the destination file a chunk of
+        entries at a time, so memory use does not grow with the database and
+        concurrent exports do not share any intermediate file.
+        
+        Args:
+            filename: Optional custom filename (without extension)
+            target_units: Units of the exported entries, None keeps the stored file as is
+            compress: Write .json.gz instead of .json, default compress_db
+        
+        Returns:
+            str: The filename of the exported JSON
+        """
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         export_name = filename or f"{self.db_name}_export_{timestamp}"
+        compress = self.compress_db if compress is None else compress
+        json_ext = ".json.gz" if compress else ".json"
+        target_json = f"{export_name}{json_ext}"
+        source_json = f"{self.db_name}{'.json.gz' if self.compress_db else '.json'}"
         
         if target_units:
             # Convert data for export
-            print(f"Exporting with custom units...")
-            export_data = {}
-            conversions_made = 0
-            
-            for entry_id, entry_data in self.data.items():
-                converted_entry = copy.deepcopy(entry_data)
-                
-                for field_name, value in converted_entry.items():
-                    if (field_name in target_units and 
-                        isinstance(value, (int, float)) and
-                        field_name in self.field_units and
-                        self.field_units[field_name] is not None):
-                        
-                        db_unit = self.field_units[field_name]
-                        target_unit = target_units[field_name]
-                        unit_type = self.field_unit_types.get(field_name)
-                        
-                        if db_unit != target_unit and unit_type:
-                            try:
-                                converted_value = self.converter.convert(
-                                    value, unit_type, db_unit, target_unit
-                                )
-                                converted_entry[field_name] = converted_value
-                                conversions_made += 1
-                            except Exception as e:
-                                print(f"  Warning: Could not convert {field_name}: {e}")
-                
-                export_data[entry_id] = converted_entry
+            logger.info("Exporting with custom units...")
+            result = FrescoResult("export_json")
+            units, entries = self._stream_entries(target_units, result, entry_ids=list(self._data))
+            self._stream_json(target_json, self._json_config(dict(units), compress), entries, compress)
             
-            # Create temporary database for export with same compression setting
-            temp_db = FrescoDatabase(f"temp_{export_name}", 
-                                            auto_save=False, 
-                                            auto_back_up=False,
-                                            compress_db=self.compress_db)
-            temp_db.data = export_data
-            temp_db.field_units = {**self.field_units, **target_units}
-            temp_db.save()
-            
-            # Rename files with proper extensions
-            json_ext = ".json.gz" if self.compress_db else ".json"
-            os.rename(f"temp_{export_name}{json_ext}", f"{export_name}{json_ext}")
-            
-            print(f"Exported with {conversions_made} unit conversions")
-        else:
+            logger.info(f"Exported with {result.conversions + result.reinforcement_conversions} unit conversions")
+        elif compress == self.compress_db and os.path.exists(source_json):
             # Simple export with current units - copy correct file format
-            json_ext = ".json.gz" if self.compress_db else ".json"
-            source_json = f"{self.db_name}{json_ext}"
-            target_json = f"{export_name}{json_ext}"
-            
             shutil.copy2(source_json, target_json)
+        else:
+            # Stored entries written like save() does, in the requested compression
+            self._stream_json(target_json, self._json_config(self._storage_units, compress, self._save_extra_config()),
+                              self._data.items(), compress)
         
-        json_ext = ".json.gz" if self.compress_db else ".json"
-        compression_info = " (compressed)" if self.compress_db else ""
-        print(f"Database exported: {export_name}{json_ext}{compression_info}")
+        compression_info = " (compressed)" if compress else ""
+        logger.info(f"Database exported: {target_json}{compression_info}")
+        return target_json
+    
+    def _stream_json(self, json_file: str, config: Dict[str, Any], entries, compress: bool):
+        """Write (entry_id, entry) pairs in the database file format as they are produced"""
+        writer = _JsonExportWriter(json_file, config, len(self._data), compress)
+        try:
+            for entry_id, entry_data in entries:
+                writer.write(entry_id, entry_data)
+        finally:
+            writer.close()
         
     def get_info(self) -> Dict[str, Any]:
         """Get database information"""
-        # Count fields by unit type
-        unit_summary = {}
-        reinforcement_fields = [field for field in self.field_config.keys() if '_reinf' in field]
-        
-        for field_name, unit in self.field_units.items():
-            if unit is not None:
-                unit_type = self.field_unit_types.get(field_name, "Other")
-                if unit_type not in unit_summary:
-                    unit_summary[unit_type] = {}
-                if unit not in unit_summary[unit_type]:
-                    unit_summary[unit_type][unit] = 0
-                unit_summary[unit_type][unit] += 1
+        reinforcement_fields = [field_name for field_name in self.field_config.keys() if '_reinf' in field_name]
+        unit_summary = self._unit_summary(self.field_units)
         
         return {
             "database_name": self.db_name,
@@ -680,22 +3079,202 @@ class FrescoDatabase:
             "dynamic_reinforcement_fields": reinforcement_fields[:10]  # Show first 10
         }
 
-    def export_to_csv(self, filename: Optional[str] = None, target_units: Optional[Dict[str, str]] = None, 
+    def _unit_summary(self, field_units: Dict[str, Optional[str]]) -> Dict[str, Dict[str, int]]:
+        """Count fields by unit type and unit"""
+        unit_summary = {}
+        for field_name, unit in field_units.items():
+            if unit is not None:
+                unit_type = self.field_unit_types.get(field_name, "Other")
+                if unit_type not in unit_summary:
+                    unit_summary[unit_type] = {}
+                if unit not in unit_summary[unit_type]:
+                    unit_summary[unit_type][unit] = 0
+                unit_summary[unit_type][unit] += 1
+        return unit_summary
+    
+    def _canonical_value(self, value: Any) -> Any:
+        """Canonical form of a stored value used for duplicate hashing"""
+        if isinstance(value, bool) or value is None:
+            return value
+        if isinstance(value, (int, float)):
+            # 6 significant digits absorb round-off from unit conversions
+            return float(f"{value:.6g}")
+        if isinstance(value, str):
+            return " ".join(value.split()).casefold()
+        return repr(value)
+
+    def find_duplicates(self, rel_tol: float = 0.01, min_similarity: float = 0.95, band_size: int = 4,
+                        max_bucket_size: int = 64, new_entries: Optional[Dict[Any, Dict[str, Any]]] = None,
+                        ignore_fields: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Report exact and near-duplicate specimens
+        
+        Entries are canonicalised into the database units (raw new_entries go
+        through the same conversion as add_entry) and hashed, so exact duplicates
+        share a content hash. Near-duplicates are found with banded numeric
+        fingerprints: numeric fields are split into bands, every value is binned
+        on a logarithmic grid of width rel_tol, and only entries sharing a band
+        bucket are compared. The cost stays roughly linear in the number of entries.
+        
+        Args:
+            rel_tol: Relative tolerance for two numeric values to count as equal
+            min_similarity: Fraction of informative numeric fields that must match
+            band_size: Number of numeric fields per fingerprint band
+            max_bucket_size: Buckets shared by more entries are ignored as uninformative
+            new_entries: Optional raw entries (add_entry format) keyed by a label,
+                checked against the database and each other as "new:<label>"
+            ignore_fields: Fields left out of the comparison (default: comments)
+        
+        Returns:
+            Dict with 'exact' groups, 'near' pairs and the number of entries scanned
+        """
+        ignore = set(ignore_fields) if ignore_fields is not None else {"comments"}
+        
+        canonical = dict(self.data)
+        if new_entries:
+            for label, raw_entry in new_entries.items():
+                canonical[f"new:{label}"] = self._normalise_entry(raw_entry)
+        
+        compared_fields = [field_name for field_name in self.field_config.keys() if field_name not in ignore]
+        numeric_fields = [
+            field_name for field_name in compared_fields
+            if self.field_config[field_name].get('data_type', 'float' if self.field_config[field_name]['unit_type'] else 'str') in ('float', 'int')
+        ]
+        
+        # Exact duplicates - identical canonical content
+        hashes = {}
+        hash_groups = {}
+        for key, entry_data in canonical.items():
+            content = [self._canonical_value(entry_data.get(field_name)) for field_name in compared_fields]
+            digest = hashlib.sha1(json.dumps(content, default=str).encode('utf-8')).hexdigest()
+            hashes[key] = digest
+            hash_groups.setdefault(digest, []).append(key)
+        exact = [group for group in hash_groups.values() if len(group) > 1]
+        
+        # Near duplicates - banded numeric fingerprints on two offset log grids
+        step = math.log1p(rel_tol)
+        bands = [numeric_fields[i:i + band_size] for i in range(0, len(numeric_fields), band_size)]
+        buckets = {}
+        for key, entry_data in canonical.items():
+            for band_index, band in enumerate(bands):
+                values = [entry_data.get(field_name) for field_name in band]
+                values = [value if isinstance(value, (int, float)) else 0 for value in values]
+                if not any(values):
+                    continue  # Defaults only - carries no information
+                
+                for offset in (0.0, 0.5):
+                    bins = tuple(
+                        None if value == 0 else (value > 0, math.floor(math.log(abs(value)) / step + offset))
+                        for value in values
+                    )
+                    buckets.setdefault((band_index, offset, bins), []).append(key)
+        
+        candidates = set()
+        skipped_buckets = 0
+        for members in buckets.values():
+            if len(members) < 2:
+                continue
+            if len(members) > max_bucket_size:
+                skipped_buckets += 1
+                continue
+            for i in range(len(members)):
+                for j in range(i + 1, len(members)):
+                    candidates.add((members[i], members[j]))
+        
+        near = []
+        for key_a, key_b in candidates:
+            if hashes[key_a] == hashes[key_b]:
+                continue  # Already reported as exact duplicate
+            
+            entry_a, entry_b = canonical[key_a], canonical[key_b]
+            informative = 0
+            matches = 0
+            differing_fields = []
+            for field_name in numeric_fields:
+                value_a, value_b = entry_a.get(field_name), entry_b.get(field_name)
+                if not isinstance(value_a, (int, float)) or not isinstance(value_b, (int, float)):
+                    continue
+                if value_a == 0 and value_b == 0:
+                    continue
+                informative += 1
+                if abs(value_a - value_b) <= rel_tol * max(abs(value_a), abs(value_b)):
+                    matches += 1
+                else:
+                    differing_fields.append(field_name)
+            
+            if not informative or matches / informative < min_similarity:
+                continue
+            
+            for field_name in compared_fields:
+                if field_name not in numeric_fields and self._canonical_value(entry_a.get(field_name)) != self._canonical_value(entry_b.get(field_name)):
+                    differing_fields.append(field_name)
+            
+            near.append({
+                "entries": (key_a, key_b),
+                "similarity": round(matches / informative, 4),
+                "differing_fields": differing_fields
+            })
+        
+        near.sort(key=lambda item: (-item["similarity"], str(item["entries"])))
+        
+        logger.info(f"Duplicate scan: {len(canonical)} entries, {len(exact)} exact groups, {len(near)} near-duplicate pairs")
+        if skipped_buckets:
+            logger.info(f"  Ignored {skipped_buckets} oversized fingerprint buckets")
+        
+        return {
+            "entries_scanned": len(canonical),
+            "exact": exact,
+            "near": near
+        }
+
+    def _stream_entries(self, target_units: Optional[Union[Dict[str, str], str]] = None,
+                        result: Optional[FrescoResult] = None, chunk_size: int = 256,
+                        entry_ids: Optional[List[int]] = None):
+        """
+        Yield (entry_id, entry) converted to target_units a chunk at a time
+        
+        Args:
+            entry_ids: Entries in the order to yield them, default all in id order
+        
+        Returns:
+            Tuple of (units of the yielded entries, generator)
+        """
+        data = self.view(target_units).data if target_units else self.data
+        entry_ids = sorted(data) if entry_ids is None else entry_ids
+        if isinstance(data, FrescoConvertedEntries):
+            return data._units, data.stream(entry_ids, chunk_size, result)
+        return self.field_units, ((entry_id, data[entry_id]) for entry_id in entry_ids)
+    
+    def _export_fields(self, selected_fields: Optional[List[str]] = None) -> List[str]:
+        """Fields to export in RCF_FIELD_CONFIG order, taken from the schema"""
+        if not selected_fields:
+            return list(self.field_config)
+        
+        invalid_fields = [f for f in selected_fields if f not in self.field_config]
+        if invalid_fields:
+            logger.warning(f"Unknown fields ignored: {invalid_fields}")
+        selected = set(selected_fields)
+        return [field_name for field_name in self.field_config if field_name in selected]
+    
+    def export_to_csv(self, filename: Optional[str] = None, target_units: Optional[Union[Dict[str, str], str]] = None, 
                     include_units_header: bool = True, selected_fields: Optional[List[str]] = None) -> str:
         """
         Export database to CSV format with optional unit conversion
         
+        Rows are converted and written as a stream, so memory use does not
+        grow with the size of the database.
+        
         Args:
             filename: Optional custom filename (without extension)
-            target_units: Dictionary of field_name -> target_unit for conversion
+            target_units: Dictionary of field_name -> target_unit for conversion, or a UNIT_SYSTEM_PRESETS name
             include_units_header: If True, adds a second header row with units
             selected_fields: Optional list of fields to export (if None, exports all)
         
         Returns:
             str: The filename of the exported CSV
         """
-        if not self.data:
-            print("Warning: No data to export")
+        if not self._data:
+            logger.warning("No data to export")
             return ""
         
         # Generate filename
@@ -704,151 +3283,268 @@ class FrescoDatabase:
         if not csv_filename.endswith('.csv'):
             csv_filename += '.csv'
         
-        print(f"Exporting to CSV: {csv_filename}")
-        
-        # Prepare data for export
-        export_data = {}
-        conversions_made = 0
-        reinforcement_conversions = 0
+        logger.info(f"Exporting to CSV: {csv_filename}")
         
-        # Convert data if target_units specified
         if target_units:
-            print(f"Converting units for CSV export...")
-            
-            for entry_id, entry_data in self.data.items():
-                converted_entry = copy.deepcopy(entry_data)
-                
-                for field_name, value in converted_entry.items():
-                    if field_name in target_units:
-                        target_unit = target_units[field_name]
-                        
-                        # Handle numeric field conversion
-                        if (isinstance(value, (int, float)) and 
-                            field_name in self.field_units and
-                            self.field_units[field_name] is not None):
-                            
-                            db_unit = self.field_units[field_name]
-                            unit_type = self.field_unit_types.get(field_name)
-                            
-                            if db_unit != target_unit and unit_type:
-                                try:
-                                    converted_value = self.converter.convert(
-                                        value, unit_type, db_unit, target_unit
-                                    )
-                                    converted_entry[field_name] = converted_value
-                                    conversions_made += 1
-                                except Exception as e:
-                                    print(f"  Warning: Could not convert {field_name}: {e}")
-                        
-                        # Handle reinforcement string conversion
-                        elif (isinstance(value, str) and 
-                            self.reinforcement_parser.is_reinforcement_field(field_name)):
-                            
-                            db_unit = self.field_units[field_name]
-                            
-                            if db_unit != target_unit:
-                                try:
-                                    converted_reinforcement = self.reinforcement_parser.parse_and_convert_reinforcement(
-                                        value, db_unit, target_unit
-                                    )
-                                    
-                                    if converted_reinforcement != value:
-                                        converted_entry[field_name] = converted_reinforcement
-                                        reinforcement_conversions += 1
-                                except Exception as e:
-                                    print(f"  Warning: Could not convert reinforcement {field_name}: {e}")
-                
-                export_data[entry_id] = converted_entry
-            
-            if conversions_made > 0:
-                print(f"  Converted {conversions_made} numeric values")
-            if reinforcement_conversions > 0:
-                print(f"  Converted {reinforcement_conversions} reinforcement strings")
-        else:
-            export_data = self.data
-        
-        # Determine fields to export - UPDATED: Use RCF_FIELD_CONFIG order
-        if selected_fields:
-            # Validate selected fields exist and maintain RCF_FIELD_CONFIG order
-            all_fields = set()
-            for entry_data in export_data.values():
-                all_fields.update(entry_data.keys())
-            
-            invalid_fields = [f for f in selected_fields if f not in all_fields]
-            if invalid_fields:
-                print(f"Warning: Unknown fields ignored: {invalid_fields}")
-            
-            # Maintain RCF_FIELD_CONFIG order for selected fields
-            fields_to_export = []
-            for field_name in self.field_config.keys():
-                if field_name in selected_fields and field_name in all_fields:
-                    fields_to_export.append(field_name)
-        else:
-            # Get all fields that exist in data, ordered by RCF_FIELD_CONFIG
-            all_fields = set()
-            for entry_data in export_data.values():
-                all_fields.update(entry_data.keys())
-            
-            fields_to_export = []
-            for field_name in self.field_config.keys():
-                if field_name in all_fields:
-                    fields_to_export.append(field_name)
+            logger.info("Converting units for CSV export...")
         
+        # Fields follow RCF_FIELD_CONFIG order
+        fields_to_export = self._export_fields(selected_fields)
         if not fields_to_export:
-            print("Error: No valid fields to export")
+            logger.error("No valid fields to export")
             return ""
         
-        # Write CSV file
-        with open(csv_filename, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.writer(csvfile)
-            
-            # Write header row with field names
-            header = ['entry_id'] + fields_to_export
-            writer.writerow(header)
-            
-            # Write units header if requested
-            if include_units_header:
-                units_row = ['ID']  # First column for entry_id
-                for field_name in fields_to_export:
-                    if target_units and field_name in target_units:
-                        unit = target_units[field_name]
-                    elif field_name in self.field_units:
-                        unit = self.field_units[field_name]
-                    else:
-                        unit = ''
-                    units_row.append(unit or '')
-                writer.writerow(units_row)
-            
-            # Write data rows
-            for entry_id in sorted(export_data.keys()):
-                entry_data = export_data[entry_id]
-                row = [entry_id]
-                
-                for field_name in fields_to_export:
-                    value = entry_data.get(field_name, '')
-                    
-                    # Handle different data types for CSV
-                    if isinstance(value, (list, dict)):
-                        # Convert complex types to string representation
-                        row.append(str(value))
-                    elif value is None:
-                        row.append('')
-                    else:
-                        row.append(value)
-                
-                writer.writerow(row)
+        result = FrescoResult("export_to_csv")
+        units, entries = self._stream_entries(target_units, result)
+        
+        # Rows are converted and formatted as the writer consumes them
+        writer = _CsvExportWriter(csv_filename, fields_to_export, units, include_units_header)
+        try:
+            writer.write_many(entries)
+        finally:
+            writer.close()
+        
+        if result.conversions > 0:
+            logger.info(f"  Converted {result.conversions} numeric values")
+        if result.reinforcement_conversions > 0:
+            logger.info(f"  Converted {result.reinforcement_conversions} reinforcement strings")
         
         # Print summary
-        total_exported = len(export_data)
+        total_exported = len(self._data)
         fields_exported = len(fields_to_export)
         
-        print(f"CSV export completed:")
-        print(f"  File: {csv_filename}")
-        print(f"  Entries: {total_exported}")
-        print(f"  Fields: {fields_exported}")
+        logger.info("CSV export completed:")
+        logger.info(f"  File: {csv_filename}")
+        logger.info(f"  Entries: {total_exported}")
+        logger.info(f"  Fields: {fields_exported}")
         if include_units_header:
-            print(f"  Units header: included")
+            logger.info("  Units header: included")
         if selected_fields:
-            print(f"  Selected fields: {len(selected_fields)} requested, {fields_exported} valid")
+            logger.info(f"  Selected fields: {len(selected_fields)} requested, {fields_exported} valid")
         
         return csv_filename
+    
+    def import_csv(self, filename: str, overwrite: bool = False, show_error_fields: bool = False,
+                   chunk_size: int = 1000, workers: Optional[int] = None) -> List[FrescoResult]:
+        """
+        Import entries from a CSV file written by export_to_csv (or edited from one)
+        
+        The first header row holds entry_id and the field names, an optional
+        second row starting with 'ID' holds the units of each column (without
+        it values are read in field_units). Rows are read in chunks of
+        chunk_size, cells are cast following the data_type of each field and
+        every column of a chunk is converted in one pass before the entries
+        are added. Empty cells are read as None and list cells as lists, as
+        export_to_csv writes them. The database is saved once at the end.
+        
+        Args:
+            filename: CSV file to read
+            overwrite: If True, allows overwriting existing entries
+            show_error_fields: If True, shows detailed validation errors
+            chunk_size: Rows held in memory at a time
+            workers: Worker processes for validating entries (see add_entries)
+        
+        Returns:
+            One FrescoResult per entry added or overwritten, in file order
+        
+        Raises:
+            ValueError: If the first column is not entry_id
+            ReinforcementSyntaxError: If a reinforcement field is malformed, the entries
+                of that chunk are not stored
+        """
+        logger.info(f"Importing from CSV: {filename}")
+        results = []
+        conversions_made = 0
+        reinforcement_conversions = 0
+        
+        auto_save = self.auto_save
+        self.auto_save = False
+        try:
+            with open(filename, 'r', newline='', encoding='utf-8') as csvfile:
+                reader = csv.reader(csvfile)
+                header = next(reader, None)
+                if not header or header[0] != 'entry_id':
+                    raise ValueError(f"{filename}: first column must be 'entry_id'")
+                
+                first_row = next(reader, None)
+                if first_row and first_row[0] == 'ID':
+                    column_units = first_row[1:]
+                    pending_rows = []
+                else:
+                    column_units = [self.field_units.get(field_name) or '' for field_name in header[1:]]
+                    pending_rows = [(reader.line_num, first_row)] if first_row else []
+                
+                columns, source_units = self._csv_columns(header[1:], column_units)
+                plan = self._get_conversion_plan(source_units, self.field_units)
+                
+                rows = itertools.chain(pending_rows, ((reader.line_num, row) for row in reader))
+                while True:
+                    chunk = list(itertools.islice(rows, chunk_size))
+                    if not chunk:
+                        break
+                    entries = {}
+                    for line_number, row in chunk:
+                        if not row or not row[0].strip():
+                            continue
+                        try:
+                            entry_id = int(row[0])
+                        except ValueError:
+                            logger.warning(f"{filename}, line {line_number}: row skipped, "
+                                           f"entry_id '{row[0]}' is not an integer")
+                            continue
+                        entries[entry_id] = {field_name: cast(row[position]) if position < len(row) else cast('')
+                                             for position, field_name, cast in columns}
+                    
+                    converted = plan.apply_to_entries(entries)
+                    conversions_made += converted[0]
+                    reinforcement_conversions += converted[1]
+                    self._tag_list_values(entries)
+                    results.extend(self.add_entries(entries, overwrite=overwrite, show_error_fields=show_error_fields,
+                                                    workers=workers))
+        finally:
+            self.auto_save = auto_save
+        
+        if conversions_made > 0:
+            logger.info(f"  Converted {conversions_made} numeric values")
+        if reinforcement_conversions > 0:
+            logger.info(f"  Converted {reinforcement_conversions} reinforcement strings")
+        logger.info(f"CSV import completed: {len(results)} entries from {filename}")
+        
+        if results and self.auto_save:
+            self.save()
+        return results
+    
+    def _tag_list_values(self, entries: Dict[int, Dict[str, Any]]):
+        """Tag two-element list values with their field unit, so add_entries does not read them as [value, unit]"""
+        for entry_data in entries.values():
+            for field_name, value in entry_data.items():
+                if isinstance(value, list) and len(value) == 2:
+                    entry_data[field_name] = [value, self.field_units.get(field_name)]
+    
+    def _csv_columns(self, field_names: List[str], column_units: List[str]):
+        """
+        Columns of a CSV header to read, with the unit of each unit-bearing column
+        
+        Returns:
+            Tuple of ([(row position, field_name, cast function)], {field_name: unit})
+        """
+        columns = []
+        source_units = {}
+        for position, (field_name, unit) in enumerate(zip(field_names, column_units), start=1):
+            config = self.field_config.get(field_name)
+            if config is None:
+                logger.warning(f"Unknown CSV column ignored: {field_name}")
+                continue
+            
+            unit_type = config.get('unit_type')
+            if unit and unit_type:
+                if not self.converter.is_valid_unit(unit_type, unit):
+                    logger.warning(f"CSV column {field_name} ignored (invalid unit '{unit}' for {unit_type})")
+                    continue
+                source_units[field_name] = unit
+            
+            data_type = _field_data_type(config)
+            columns.append((position, field_name, _cast_csv_text if data_type == 'str' else _cast_csv_number))
+        return columns, source_units
+
+
+def _cast_csv_number(text: str) -> Any:
+    """CSV cell of a numeric field: int or float as written, None when empty, lists as written by _csv_row, other text kept"""
+    if not text:
+        return None
+    try:
+        return int(text)
+    except ValueError:
+        pass
+    try:
+        return float(text)
+    except ValueError:
+        pass
+    if text[0] == '[' and text[-1] == ']':
+        try:
+            return ast.literal_eval(text)
+        except (ValueError, SyntaxError):
+            pass
+    return text
+
+
+def _cast_csv_text(text: str) -> Optional[str]:
+    """CSV cell of a text field, None when empty as _csv_row writes None"""
+    return text if text else None
+
+
+def _chunked(items, chunk_size: int):
+    """Lists of up to chunk_size consecutive items"""
+    iterator = iter(items)
+    while True:
+        chunk = list(itertools.islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _drain_export_queue(writer, chunks: 'queue.Queue'):
+    """Export writer thread: write chunks of (entry_id, entry) until None arrives, then close"""
+    try:
+        while True:
+            chunk = chunks.get()
+            if chunk is None:
+                break
+            for entry_id, entry_data in chunk:
+                writer.write(entry_id, entry_data)
+    finally:
+        writer.close()
+
+
+def _put_export_chunk(chunks: 'queue.Queue', future, chunk):
+    """Hand a chunk to a writer thread, without blocking forever on a writer that failed"""
+    while not future.done():
+        try:
+            chunks.put(chunk, timeout=0.1)
+            return
+        except queue.Full:
+            pass
+    if chunk is not None:
+        # Raises the writer's error
+        future.result()
+
+
+# Database used by add_entries() worker processes, set up once per process
+_WORKER_DATABASE: Optional[FrescoDatabase] = None
+
+
+def _init_entry_worker(settings: Dict[str, Any]):
+    """Process pool initializer: build an in-memory database matching the parent's units"""
+    global _WORKER_DATABASE
+    logger.setLevel(settings["log_level"])
+    # Nothing is read or written, the empty folder only gives the database a path that does not exist
+    with tempfile.TemporaryDirectory() as folder, _captured_log_records():
+        database = FrescoDatabase(os.path.join(folder, "worker"), settings["field_config"], settings["empty_field_config"],
+                                  auto_save=False, auto_back_up=False, compress_db=False,
+                                  show_conversion=settings["show_conversion"],
+                                  show_invalid_object=settings["show_invalid_object"],
+                                  show_invalid_unit=settings["show_invalid_unit"])
+    
+    for unit_type, units in (settings["unit_overrides"] or {}).items():
+        for unit, to_base_factor in units.items():
+            database.converter.register_unit(unit_type, unit, to_base_factor)
+    database.field_units = dict(settings["field_units"])
+    if settings["canonical_units"] is not None:
+        database.lossless_units = True
+        database._canonical_units = dict(settings["canonical_units"])
+    _WORKER_DATABASE = database
+
+
+def _normalise_entry_logged(database: FrescoDatabase, entry_id: int, entry_data: Dict[str, Any],
+                            show_error_fields: bool) -> Tuple[int, List[logging.LogRecord], Dict[str, Any], FrescoResult]:
+    """Normalise one entry, holding back its log records so they can be replayed in entry order"""
+    result = FrescoResult("add_entry", entry_id)
+    with _captured_log_records() as records:
+        normalised = database._normalise_entry(entry_data, show_error_fields, result)
+    return entry_id, records, normalised, result
+
+
+def _normalise_entry_chunk(chunk: List[Tuple[int, Dict[str, Any]]], show_error_fields: bool) -> List[Tuple[int, List[logging.LogRecord], Dict[str, Any], FrescoResult]]:
+    """Normalise a chunk of (entry_id, entry_data) in a worker, returning (entry_id, log records, entry, result)"""
+    return [_normalise_entry_logged(_WORKER_DATABASE, entry_id, entry_data, show_error_fields)
+            for entry_id, entry_data in chunk]
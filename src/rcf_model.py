@@ -1,4 +1,3 @@
-import re
 import math
 import FreeCAD
 import Part
@@ -81,30 +80,11 @@ class RCFrameGenerator:
     def _parse_reinforcement_string(self, rebar_string):
         """
         Parse reinforcement notation like '4#20+2#16' or '2#8@150'
-        Returns list of (count, diameter, spacing) tuples
+        Returns list of (count, diameter, spacing) tuples, raises
+        ReinforcementSyntaxError (a ValueError) for malformed notation
         """
-        if not rebar_string or rebar_string == "":
-            return []
-        
-        # Split by '+' for compound reinforcement
-        parts = rebar_string.split('+')
-        reinforcement = []
-        
-        for part in parts:
-            part = part.strip()
-            
-            # Pattern for reinforcement: optional count + # + diameter + optional @spacing
-            pattern = r'(\d*)#(\d+(?:\.\d+)?)(?:@(\d+(?:\.\d+)?))?'
-            match = re.match(pattern, part)
-            
-            if match:
-                count_str, diameter_str, spacing_str = match.groups()
-                count = int(count_str) if count_str else 1
-                diameter = float(diameter_str)
-                spacing = float(spacing_str) if spacing_str else None
-                reinforcement.append((count, diameter, spacing))
-        
-        return reinforcement
+        # Shared with the database, each distinct string is parsed only once
+        return list(self.db.reinforcement_parser.parse(rebar_string))
 
     def _transverse_reinforcement(self, type, cs_dimx, cs_dimz, cover, reinf_d, translate=(0,0,0), rot_x=0, rot_y=0, rot_z=0):
         """
@@ -1181,6 +1161,21 @@ class RCFrameGenerator:
                 interface_shape0.translate(FreeCAD.Vector(0, 0, inf_dp))
                 self._cad_add_shape_to_feature_to_part("Interfaces", interface_shape0, self.infill_assembly)
 
+    def check_db_models(self, database_entry_ids: Optional[List[int]] = None):
+        """
+        Report entries that break the geometry and reinforcement rules of the generator
+        
+        Run it before a batch of generate_db_model calls to skip specimens that
+        would fail halfway through a FreeCAD run.
+        
+        Args:
+            database_entry_ids: Entries to check, None checks the whole database
+        
+        Returns:
+            List of FrescoConsistencyIssue (entry_id, rule, fields, message)
+        """
+        return self.db.check_consistency(entry_ids=database_entry_ids)
+
     def generate_db_model(self, database_entry_id:int):
         
         self.DATABASE_ENTRY_ID = database_entry_id
@@ -0,0 +1,60 @@
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from src.database_editor import CONSISTENCY_RULES, FrescoDatabase
+
+
+class ConsistencyRulesTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.folder = tempfile.mkdtemp()
+        shutil.copy(os.path.join(ROOT, "Database", "fresco_v1.json"), cls.folder)
+        cls.db = FrescoDatabase(os.path.join(cls.folder, "fresco_v1"), auto_save=False, auto_back_up=False,
+                                compress_db=False)
+    
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.folder)
+    
+    def test_shipped_specimens(self):
+        issues = {(issue.entry_id, issue.rule, issue.severity) for issue in self.db.check_consistency()}
+        self.assertEqual(issues, {
+            (48, 'infill_bond_pattern', 'warning'),
+            (49, 'infill_bond_pattern', 'warning'),
+            (50, 'infill_bond_pattern', 'warning'),
+            (51, 'infill_bond_pattern', 'warning'),
+            (96, 'steel_strength_order', 'error'),
+        })
+    
+    def test_corner_bars_read_first_group(self):
+        rule = {'col_corner_bars': CONSISTENCY_RULES['col_corner_bars']}
+        corner = self.db.data[1]['col_long_reinf_corner']
+        try:
+            self.db.update_entry(1, {'col_long_reinf_corner': "2#16+2#12"})
+            self.assertEqual(len(self.db.check_consistency(rule, [1])), 1)
+            self.db.update_entry(1, {'col_long_reinf_corner': "4#16+2#12"})
+            self.assertEqual(self.db.check_consistency(rule, [1]), [])
+        finally:
+            self.db.update_entry(1, {'col_long_reinf_corner': corner})
+    
+    def test_base_beam_reinforcement_fits(self):
+        rules = {name: CONSISTENCY_RULES[name] for name in ('bbm_reinforcement_width', 'bbm_reinforcement_height')}
+        self.assertEqual(self.db.check_consistency(rules), [])
+        
+        bbm_t = self.db.data[1]['bbm_t']
+        try:
+            self.db.update_entry(1, {'bbm_t': 2 * self.db.data[1]['bbm_cover']})
+            self.assertEqual([issue.rule for issue in self.db.check_consistency(rules, [1])],
+                             ['bbm_reinforcement_width'])
+        finally:
+            self.db.update_entry(1, {'bbm_t': bbm_t})
+
+
+if __name__ == "__main__":
+    unittest.main()
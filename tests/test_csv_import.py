@@ -0,0 +1,60 @@
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from src.database_editor import FrescoDatabase
+
+
+class CsvImportTest(unittest.TestCase):
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        shutil.copy(os.path.join(ROOT, "Database", "fresco_v1.json"), self.folder)
+        self.db = FrescoDatabase(os.path.join(self.folder, "fresco_v1"), auto_back_up=False, compress_db=False)
+    
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+    
+    def imported(self, csv_file, **kwargs):
+        database = FrescoDatabase(os.path.join(self.folder, "imported"), auto_back_up=False, compress_db=False)
+        database.import_csv(csv_file, **kwargs)
+        return database
+    
+    def test_round_trip(self):
+        self.db.update_entry(1, {"comments": None, "fy": None, "fu": [[420, 510], "MPa"]})
+        csv_file = os.path.join(self.folder, "export.csv")
+        self.db.export_to_csv(csv_file)
+        
+        imported = self.imported(csv_file)
+        self.assertEqual(imported.data, self.db.data)
+        self.assertEqual(imported.data[1]["fu"], [420, 510])
+        self.assertEqual(imported.data[96]["fu"], [503, 4, 'MPa'])
+    
+    def test_round_trip_in_other_units(self):
+        csv_file = os.path.join(self.folder, "export_us.csv")
+        self.db.export_to_csv(csv_file, target_units="US")
+        
+        imported = self.imported(csv_file)
+        for entry_id, entry_data in self.db.data.items():
+            for field_name, value in entry_data.items():
+                if isinstance(value, float):
+                    self.assertAlmostEqual(imported.data[entry_id][field_name], value, places=6, msg=field_name)
+    
+    def test_non_integer_entry_id_is_skipped(self):
+        csv_file = os.path.join(self.folder, "export.csv")
+        self.db.export_to_csv(csv_file)
+        with open(csv_file, "a", encoding="utf-8") as f:
+            f.write("Total,notes\n")
+        
+        with self.assertLogs("src.database_editor", "WARNING") as logs:
+            imported = self.imported(csv_file)
+        self.assertEqual(len(imported.data), len(self.db.data))
+        self.assertTrue(any("entry_id 'Total' is not an integer" in line for line in logs.output))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from src.database_editor import FrescoDatabase
+
+
+class DeltaExportTest(unittest.TestCase):
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        shutil.copy(os.path.join(ROOT, "Database", "fresco_v1.json"), self.folder)
+        self.source = FrescoDatabase(self.path("fresco_v1"), auto_back_up=False, compress_db=False)
+    
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+    
+    def path(self, name):
+        return os.path.join(self.folder, name)
+    
+    def mirror(self, units):
+        self.source.export_json(self.path("mirror"), target_units=units)
+        return FrescoDatabase(self.path("mirror"), auto_back_up=False, compress_db=False)
+    
+    def curate(self):
+        self.source.update_entry(5, {"col_h": [30.3, "cm"], "fu": [[420, 510], "MPa"]})
+        self.source.remove_entry(7)
+        self.source.add_entry(500, {"specimen_id": "NEW", "frm_h": [2.03, "m"],
+                                    "col_long_reinf_corner": ["4#16", "mm"]})
+    
+    def test_patch_matches_full_export(self):
+        mirror = self.mirror("SI-m")
+        manifest = self.source.export_manifest(self.path("base"), target_units="US")
+        self.curate()
+        patch = self.source.export_patch(manifest, self.path("round_1"), compress=True)
+        
+        self.assertEqual(mirror.apply_patch(patch), {"added": [500], "changed": [5], "removed": [7]})
+        # Same values, bit for bit, as a mirror rebuilt from a full export
+        self.assertEqual(dict(mirror.data), dict(self.source.view("SI-m").data))
+        self.assertEqual(mirror.data[5]["fu"], [420, 510])
+        
+        # The next manifest is the base of an empty patch
+        empty = self.source.export_patch(self.path("round_1.manifest.json"), self.path("round_2"), compress=False)
+        self.assertEqual(mirror.apply_patch(empty), {"added": [], "changed": [], "removed": []})
+    
+    def test_verify_rejects_a_mirror_not_at_the_base(self):
+        mirror = self.mirror("US")
+        manifest = self.source.export_manifest(self.path("base"))
+        self.curate()
+        patch = self.source.export_patch(manifest, self.path("round_1"))
+        
+        mirror.update_entry(5, {"col_d": [1, "m"]})
+        with self.assertRaisesRegex(ValueError, r"entries \[5\]"):
+            mirror.apply_patch(patch)
+        self.assertIn(7, mirror.data)
+        
+        mirror.apply_patch(patch, verify=False)
+        self.assertNotIn(7, mirror.data)
+        with self.assertRaisesRegex(ValueError, r"entries \[5, 7, 500\]"):
+            mirror.apply_patch(patch)
+    
+    def test_rejects_other_files(self):
+        with self.assertRaisesRegex(ValueError, "Not a fresco-manifest file"):
+            self.source.export_patch(self.path("fresco_v1.json"))
+        
+        manifest = self.source.export_manifest(self.path("base"))
+        with open(manifest, encoding="utf-8") as f:
+            content = json.load(f)
+        content["version"] += 1
+        with self.assertRaisesRegex(ValueError, "Unsupported fresco-manifest version"):
+            self.source.export_patch(content)
+        with self.assertRaisesRegex(ValueError, "Not a fresco-patch file"):
+            self.source.apply_patch(manifest)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,38 @@
+import math
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.database_editor import FrescoDatabase
+
+
+class DerivedMetricsTest(unittest.TestCase):
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+        self.db = FrescoDatabase(os.path.join(self.folder.name, "db"), compress_db=False, auto_back_up=False)
+        self.db.add_entry(1, {"specimen_id": "A", "col_h": [300, "mm"], "col_d": [250, "mm"],
+                              "col_cover": [25, "mm"], "col_trans_mid_reinf": ["2#8@100", "mm"],
+                              "col_trans_crit_top_reinf": ["2#8", "mm"]})
+    
+    def tearDown(self):
+        self.folder.cleanup()
+    
+    def test_hoop_ratio_uses_one_hoop_per_spacing(self):
+        core_height, core_width = 250, 200
+        expected = math.pi * 8 ** 2 / 4 * 2 * (core_height + core_width) / (core_height * core_width * 100)
+        self.assertAlmostEqual(self.db.get_field(1, "col_trans_mid_ratio"), expected)
+    
+    def test_hoops_without_spacing_are_missing(self):
+        self.assertIsNone(self.db.get_field(1, "col_trans_crit_top_ratio"))
+    
+    def test_units_follow_field_units(self):
+        self.assertEqual(self.db.derived_field_units["col_long_steel_area"], "mm^2")
+        self.db.set_field_units({"col_h": "cm"})
+        self.assertEqual(self.db.derived_field_units["col_long_steel_area"], "cm^2")
+
+
+if __name__ == "__main__":
+    unittest.main()
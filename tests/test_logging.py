@@ -0,0 +1,44 @@
+import logging
+import os
+import sys
+import threading
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.database_editor import _captured_log_records, logger
+
+
+class CapturedLogRecordsTest(unittest.TestCase):
+    def test_capture_is_scoped_to_the_thread(self):
+        started, done = threading.Event(), threading.Event()
+        
+        def log_from_other_thread():
+            started.wait()
+            logger.warning("other thread")
+            done.set()
+        
+        thread = threading.Thread(target=log_from_other_thread)
+        thread.start()
+        with self.assertLogs(logger, logging.INFO) as logs:
+            with _captured_log_records() as records:
+                logger.warning("captured %s", "here")
+                started.set()
+                done.wait()
+            thread.join()
+            logger.info("after")
+        
+        self.assertEqual([record.getMessage() for record in records], ["captured here"])
+        self.assertEqual(logs.output, ["WARNING:src.database_editor:other thread", "INFO:src.database_editor:after"])
+    
+    def test_nested_capture_restores_outer(self):
+        with _captured_log_records() as outer:
+            with _captured_log_records() as inner:
+                logger.warning("inner")
+            logger.warning("outer")
+        self.assertEqual([record.getMessage() for record in inner], ["inner"])
+        self.assertEqual([record.getMessage() for record in outer], ["outer"])
+
+
+if __name__ == "__main__":
+    unittest.main()
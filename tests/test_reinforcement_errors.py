@@ -0,0 +1,34 @@
+import os
+import pickle
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.database_editor import FrescoDatabase, ReinforcementSyntaxError
+
+
+class ReinforcementSyntaxErrorTest(unittest.TestCase):
+    def test_pickle_round_trip(self):
+        error = ReinforcementSyntaxError("4#16x", 4, "'+' or end of string", "col_long_reinf_corner")
+        restored = pickle.loads(pickle.dumps(error))
+        
+        self.assertIsInstance(restored, ReinforcementSyntaxError)
+        self.assertEqual(str(restored), str(error))
+        self.assertEqual((restored.rebar_string, restored.position, restored.expected, restored.field_name),
+                         (error.rebar_string, error.position, error.expected, error.field_name))
+    
+    def test_add_entries_with_workers_raises_syntax_error(self):
+        with tempfile.TemporaryDirectory() as folder:
+            db = FrescoDatabase(os.path.join(folder, "db"), compress_db=False, auto_back_up=False)
+            entries = {
+                1: {"specimen_id": "A", "col_long_reinf_corner": ["4#16", "mm"]},
+                2: {"specimen_id": "B", "col_long_reinf_corner": ["4#16x", "mm"]},
+            }
+            with self.assertRaises(ReinforcementSyntaxError):
+                db.add_entries(entries, workers=2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.database_editor import FrescoCatalogue, FrescoDatabase
+
+
+def specimen(specimen_id, col_h=300):
+    return {"specimen_id": specimen_id, "col_h": [col_h, "mm"], "col_long_reinf_corner": ["4#16", "mm"]}
+
+
+class SyncEntriesTest(unittest.TestCase):
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+        self.db = FrescoDatabase(os.path.join(self.folder.name, "db"), compress_db=False, auto_back_up=False)
+    
+    def tearDown(self):
+        self.folder.cleanup()
+    
+    def test_change_detection(self):
+        catalogue = {1: specimen("A"), 2: specimen("B"), 3: specimen("C")}
+        self.assertEqual(self.db.sync_entries(catalogue),
+                         {"added": [1, 2, 3], "changed": [], "removed": [], "unchanged": 0})
+        self.assertEqual(self.db.sync_entries(catalogue),
+                         {"added": [], "changed": [], "removed": [], "unchanged": 3})
+        
+        catalogue[2] = specimen("B", col_h=350)
+        del catalogue[3]
+        catalogue[4] = specimen("D")
+        self.assertEqual(self.db.sync_entries(catalogue),
+                         {"added": [4], "changed": [2], "removed": [3], "unchanged": 1})
+        self.assertEqual(self.db.data[2]["col_h"], 350)
+        self.assertNotIn(3, self.db.data)
+    
+    def test_hand_added_entries_are_kept(self):
+        self.db.sync_entries({1: specimen("A")})
+        self.db.add_entry(10, specimen("Manual"))
+        self.assertEqual(self.db.sync_entries({})["removed"], [1])
+        self.assertEqual(list(self.db.data), [10])
+    
+    def test_hashes_survive_reload(self):
+        catalogue = {1: specimen("A"), 2: specimen("B")}
+        self.db.sync_entries(catalogue)
+        reloaded = FrescoDatabase(self.db.db_name, compress_db=False, auto_back_up=False)
+        self.assertEqual(reloaded.sync_entries(catalogue)["unchanged"], 2)
+
+
+class CatalogueManifestTest(unittest.TestCase):
+    def test_malformed_manifest_raises_value_error(self):
+        with tempfile.TemporaryDirectory() as folder:
+            catalogue = FrescoCatalogue.write({"A": specimen("A")}, folder)
+            with open(os.path.join(folder, FrescoCatalogue.MANIFEST), "w", encoding="utf-8") as f:
+                json.dump({"specimens": [{"key": "A"}]}, f)
+            os.utime(os.path.join(folder, FrescoCatalogue.MANIFEST), ns=(1, 1))
+            
+            with self.assertRaises(ValueError):
+                catalogue.refresh()
+            # Reported once, the previous specimen list is kept until the next save
+            self.assertEqual(catalogue.refresh(), set())
+            self.assertEqual(list(catalogue), ["A"])
+            with self.assertRaises(ValueError):
+                FrescoCatalogue(folder)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,51 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.database_editor import FrescoUnits
+
+
+class FrescoUnitsTest(unittest.TestCase):
+    def setUp(self):
+        self.units = FrescoUnits()
+    
+    def test_listed_units(self):
+        self.assertEqual(self.units.convert(1.5, 'Length', 'm', 'mm'), 1500.0)
+        self.assertEqual(self.units.convert(20, 'Temperature', 'C', 'K'), 293.15)
+        self.assertEqual(self.units.convert(7, 'Length', 'cm', 'cm'), 7)
+    
+    def test_unknown_unit_type_raises_key_error(self):
+        with self.assertRaisesRegex(KeyError, "Unit type 'Bogus' not recognized"):
+            self.units.convert(1, 'Bogus', 'm', 'm')
+        with self.assertRaises(KeyError):
+            self.units.get_conversion_factor('Bogus', 'm', 'mm')
+    
+    def test_unknown_unit_raises_key_error(self):
+        with self.assertRaisesRegex(KeyError, "From unit 'furlong'"):
+            self.units.convert(1, 'Length', 'furlong', 'm')
+        with self.assertRaisesRegex(KeyError, "To unit 'kN'"):
+            self.units.convert(1, 'Length', 'm', 'kN')
+    
+    def test_non_string_unit_is_invalid(self):
+        self.assertFalse(self.units.is_valid_unit('Pressure', 2))
+        with self.assertRaises(KeyError):
+            self.units.convert(1, 'Pressure', 2, 'MPa')
+    
+    def test_compound_units(self):
+        self.assertAlmostEqual(self.units.convert(1, 'Pressure', 'kN/m^2', 'kPa'), 1.0)
+        self.assertAlmostEqual(self.units.convert_expression(1, 'kN*m', 'N*mm'), 1e6)
+        with self.assertRaises(KeyError):
+            self.units.convert_expression(1, 'kN', 'm')
+    
+    def test_register_unit_is_per_instance(self):
+        self.units.register_unit('Length', 'yd', 0.9144)
+        self.assertAlmostEqual(self.units.convert(1, 'Length', 'yd', 'm'), 0.9144)
+        self.assertFalse(FrescoUnits().is_valid_unit('Length', 'yd'))
+        with self.assertRaises(ValueError):
+            self.units.register_unit('Temperature', 'R', 5 / 9)
+
+
+if __name__ == "__main__":
+    unittest.main()